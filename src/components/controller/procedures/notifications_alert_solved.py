@@ -6,6 +6,7 @@ identified notifications.
 import logging
 
 import databases
+from internal_database import get_session
 from models import Notification
 
 from .constants import SQL_FILES_PATH
@@ -23,11 +24,18 @@ async def notifications_alert_solved() -> None:
         _logger.error("Error with query result")
         return
 
-    for notification_info in result:
-        notification = await Notification.get_by_id(notification_info["id"])
-        if notification is None:
-            _logger.error(f"Notification with id {notification_info['id']!r} not found")
-            continue
+    notifications_ids = [notification_info["id"] for notification_info in result]
+    notifications = await Notification.get_all(Notification.id.in_(notifications_ids))
 
-        await notification.close()
+    found_ids = {notification.id for notification in notifications}
+    for notification_id in notifications_ids:
+        if notification_id not in found_ids:
+            _logger.error(f"Notification with id {notification_id!r} not found")
+
+    # Close all the notifications in a single transaction
+    async with get_session() as session:
+        for notification in notifications:
+            await notification.close(session=session)
+
+    for notification in notifications:
         _logger.warning(f"{notification} closed")
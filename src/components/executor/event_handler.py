@@ -5,7 +5,7 @@ from functools import partial
 from typing import Any
 
 import prometheus_client
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 import registry as registry
 from configs import configs
@@ -15,6 +15,8 @@ from models import Monitor
 
 _logger = logging.getLogger("event_handler")
 
+_payload_adapter = TypeAdapter(EventPayload)
+
 prometheus_reaction_error_count = prometheus_client.Counter(
     "executor_reaction_execution_error",
     "Error count for reactions",
@@ -36,7 +38,7 @@ async def run(message: dict[Any, Any]) -> None:
     """Process a message with type 'event' using the monitor's defined list of reactions for the
     event. The execution timeout is for each function individually"""
     try:
-        event_payload = EventPayload(**message["payload"])
+        event_payload = _payload_adapter.validate_python(message["payload"])
     except KeyError:
         _logger.error(f"Message {json.dumps(message)!r} missing 'payload' field")
         return
@@ -5,11 +5,12 @@ from datetime import datetime
 from typing import Any, Literal, cast
 
 import prometheus_client
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 import components.task_manager as task_manager
 import registry as registry
 from configs import configs
+from data_models.monitor_options import AgeRule, CountRule, ValueRule
 from data_models.process_monitor_payload import ProcessMonitorPayload
 from exceptions.base import BaseSentinelaException
 from internal_database import get_session
@@ -19,6 +20,8 @@ from utils.time import now
 
 _logger = logging.getLogger("monitor_handler")
 
+_payload_adapter = TypeAdapter(ProcessMonitorPayload)
+
 prometheus_monitor_error_count = prometheus_client.Counter(
     "executor_monitor_execution_error",
     "Error count for monitors",
@@ -107,6 +110,10 @@ async def _search_routine(monitor: Monitor) -> None:
     # Get the active issues ids to check if any of the found issues already exists
     active_issues_ids = {issue.model_id for issue in monitor.active_issues}
 
+    # Get the monitor's settings and functions once, instead of for every found issue
+    model_id_key = monitor.issue_options.model_id_key
+    is_solved_function = monitor.is_solved_function
+
     # Check all the found issues
     new_issues_data = {}
     for raw_issue_data in found_issues_data:
@@ -118,8 +125,6 @@ async def _search_routine(monitor: Monitor) -> None:
             )
             continue
 
-        model_id_key = monitor.issue_options.model_id_key
-
         # Checking if the model id key is in the dictionary
         if model_id_key not in issue_data:
             _logger.warning(
@@ -138,18 +143,24 @@ async def _search_routine(monitor: Monitor) -> None:
             _logger.warning(f"Found duplicate model id {model_id!r}. Skipping this one")
             continue
 
-        # Check it's uniqueness
-        if monitor.issue_options.unique:
-            if not await Issue.is_unique(monitor_id=monitor.id, model_id=model_id):
-                continue
-
         # Check if it's considered as solved
-        if monitor.is_solved_function(issue_data):
+        if is_solved_function(issue_data):
             continue
 
         # Add it to the new issues list if all checks passed
         new_issues_data[model_id] = issue_data
 
+    # Check the uniqueness of all the new issues at once
+    if monitor.issue_options.unique:
+        existing_model_ids = await Issue.get_existing_model_ids(
+            monitor_id=monitor.id, model_ids=list(new_issues_data.keys())
+        )
+        new_issues_data = {
+            model_id: issue_data
+            for model_id, issue_data in new_issues_data.items()
+            if model_id not in existing_model_ids
+        }
+
     # Limit the number of issues being created
     # Doing it after filtering the new issues to avoid losing newer ones
     max_issues = monitor.options.max_issues_creation
@@ -200,6 +211,7 @@ async def _update_routine(monitor: Monitor) -> None:
         return
 
     active_issues_map = {issue.model_id: issue for issue in monitor.active_issues}
+    model_id_key = monitor.issue_options.model_id_key
 
     # Check all the found issues
     issues_update_tasks_info: dict[str, tuple[Issue, dict[Any, Any]]] = {}
@@ -212,8 +224,6 @@ async def _update_routine(monitor: Monitor) -> None:
             )
             continue
 
-        model_id_key = monitor.issue_options.model_id_key
-
         # Checking if the model id key is in the dictionary
         if model_id_key not in issue_data:
             _logger.warning(
@@ -246,11 +256,23 @@ async def _update_routine(monitor: Monitor) -> None:
 
 async def _issues_solve_routine(monitor: Monitor) -> None:
     """Issue solve routine for the monitor, checking all issues against the 'is_solved' function"""
+    # Issues that are not solvable are never solved by the 'is_solved' function
+    if not monitor.issue_options.solvable or len(monitor.active_issues) == 0:
+        return
+
     async with get_session() as session:
         for issue in monitor.active_issues:
             await issue.check_solved(session=session)
 
 
+async def _update_alert(alert: Alert, rule: AgeRule | CountRule | ValueRule) -> None:
+    """Update the alert's priority and status, loading only the active issues' columns used by the
+    priority rule, once for both updates"""
+    active_issues = await alert.get_active_issues_rows(rule)
+    await alert.update_priority(active_issues)
+    await alert.update(len(active_issues))
+
+
 async def _alerts_routine(monitor: Monitor) -> None:
     """Alert routine for the monitor, creating, linking issues, updating and solving them"""
     # As 'alert_options' can be None, check it before executing
@@ -280,8 +302,8 @@ async def _alerts_routine(monitor: Monitor) -> None:
         if alert is not None:
             await alert.link_issues(issue_without_alerts)
 
-    await do_concurrently(*[alert.update_priority() for alert in monitor.active_alerts])
-    await do_concurrently(*[alert.update() for alert in monitor.active_alerts])
+    rule = monitor.alert_options.rule
+    await do_concurrently(*[_update_alert(alert, rule) for alert in monitor.active_alerts])
 
 
 async def _run_routines(monitor: Monitor, tasks: list[Literal["search", "update"]]) -> None:
@@ -334,7 +356,7 @@ async def run(message: dict[Any, Any]) -> None:
     """Process a message with type 'process_monitor', loading the monitor and executing it's
     routines, while also detecting errors and reporting them accordingly"""
     try:
-        message_payload = ProcessMonitorPayload(**message["payload"])
+        message_payload = _payload_adapter.validate_python(message["payload"])
     except KeyError:
         _logger.error(f"Message {json.dumps(message)!r} missing 'payload' field")
         return
@@ -4,7 +4,7 @@ import logging
 from typing import Any, Callable, Coroutine, cast
 
 import prometheus_client
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 import registry as registry
 from configs import configs
@@ -15,6 +15,8 @@ from plugins.attribute_select import get_plugin_attribute
 
 _logger = logging.getLogger("request_handler")
 
+_payload_adapter = TypeAdapter(RequestPayload)
+
 prometheus_request_error_count = prometheus_client.Counter(
     "executor_request_execution_error",
     "Error count for requests",
@@ -141,7 +143,7 @@ def get_action(action_name: str) -> Callable[[RequestPayload], Coroutine[Any, An
 async def run(message: dict[Any, Any]) -> None:
     """Process a received request"""
     try:
-        message_payload = RequestPayload(**message["payload"])
+        message_payload = _payload_adapter.validate_python(message["payload"])
     except KeyError:
         _logger.error(f"Message {json.dumps(message)!r} missing 'payload' field")
         return
@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 
 from pydantic.dataclasses import dataclass
@@ -25,9 +26,18 @@ class EventPayload:
     event_data: dict[str, Any]
     extra_payload: dict[str, Any] | None = None
 
+    def __post_init__(self) -> None:
+        # Event sources and names come from a small set of values but are decoded as new strings
+        # for every message. Interning them avoids keeping duplicates and speeds up the lookups
+        # that use them as keys
+        self.event_source = sys.intern(self.event_source)
+        self.event_name = sys.intern(self.event_name)
+
     def to_dict(self) -> dict[str, Any]:
         return {
-            field: value
-            for field in self.__dataclass_fields__
-            if (value := getattr(self, field)) is not None
+            field: value for field in _FIELDS if (value := self.__dict__.get(field)) is not None
         }
+
+
+# Field names are fixed at class creation, so they're computed once instead of on every call
+_FIELDS = tuple(EventPayload.__dataclass_fields__)
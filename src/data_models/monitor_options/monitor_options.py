@@ -1,4 +1,5 @@
 from dataclasses import field
+from functools import cached_property
 from typing import Any, Callable, Coroutine, cast
 
 from pydantic.dataclasses import dataclass
@@ -65,6 +66,19 @@ class PriorityLevels:
     def __getitem__(self, name: str) -> int | None:
         return cast(int | None, getattr(self, name))
 
+    @cached_property
+    def sorted_levels(self) -> tuple[tuple[str, int], ...]:
+        """Defined levels as '(name, value)' pairs, from the highest priority to the lowest. It's
+        calculated only once, as the levels don't change after the monitor is loaded"""
+        levels = (
+            ("critical", self.critical),
+            ("high", self.high),
+            ("moderate", self.moderate),
+            ("low", self.low),
+            ("informational", self.informational),
+        )
+        return tuple((name, value) for name, value in levels if value is not None)
+
 
 @dataclass
 class AgeRule:
@@ -10,7 +10,8 @@ class RequestPayload:
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            field: value
-            for field in self.__dataclass_fields__
-            if (value := getattr(self, field)) is not None
+            field: value for field in _FIELDS if (value := self.__dict__.get(field)) is not None
         }
+
+
+_FIELDS = tuple(RequestPayload.__dataclass_fields__)
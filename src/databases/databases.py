@@ -1,12 +1,13 @@
 import asyncio
 import enum
-import json
 import logging
 import os
 import time
 import traceback
+from dataclasses import dataclass
 from typing import Any, Coroutine, cast
 
+import utils.json_tools as json_tools
 from configs import configs
 from plugins.pool_select import get_plugin_pool
 from utils.async_tools import do_concurrently
@@ -18,6 +19,9 @@ _logger = logging.getLogger("database")
 _pool_cache: dict[str, type[Pool]] = {}
 _pools: dict[str, Pool] = {}
 
+METRICS_QUEUE_SIZE = 10000
+METRICS_BATCH_SIZE = 256
+
 
 class QueryStatus(enum.Enum):
     success = "success"
@@ -25,20 +29,89 @@ class QueryStatus(enum.Enum):
     error = "error"
 
 
+@dataclass(slots=True)
+class QueryMetrics:
+    pool_name: str
+    query: str
+    args: tuple[Any, ...]
+    status: str | None = None
+    error: str | None = None
+    start_time: float | None = None
+    end_time: float | None = None
+    query_time: float | None = None
+
+
+_metrics_queue: asyncio.Queue[QueryMetrics] | None = None
+_metrics_task: asyncio.Task[None] | None = None
+
+
+def _log_metrics(metrics: QueryMetrics) -> None:
+    """Log the query metrics as a JSON object"""
+    # Shallow dict, as 'dataclasses.asdict' deep copies all the fields, including the query args
+    metrics_dict = {name: getattr(metrics, name) for name in QueryMetrics.__slots__}
+    try:
+        message = json_tools.dumps(metrics_dict)
+    except TypeError:
+        # Query args of types that can't be serialized are logged as a string
+        metrics_dict["args"] = str(metrics.args)
+        message = json_tools.dumps(metrics_dict)
+    _logger.info(message)
+
+
+def _flush_metrics(metrics_queue: asyncio.Queue[QueryMetrics], limit: int | None = None) -> None:
+    """Log the query metrics waiting in the queue, up to 'limit' items if provided"""
+    count = 0
+    while not metrics_queue.empty() and (limit is None or count < limit):
+        metrics = metrics_queue.get_nowait()
+        _log_metrics(metrics)
+        count += 1
+
+
+async def _metrics_logger(metrics_queue: asyncio.Queue[QueryMetrics]) -> None:
+    """Log the query metrics in the background, keeping their serialization out of the queries
+    path"""
+    while True:
+        metrics = await metrics_queue.get()
+        _log_metrics(metrics)
+        _flush_metrics(metrics_queue, METRICS_BATCH_SIZE - 1)
+
+
+async def _init_pool(
+    pool_class: type[Pool],
+    env_var_name: str,
+    dsn: str,
+    database_name: str,
+    pool_configs: dict[str, Any],
+) -> None:
+    """Create and initialize a database pool, logging any errors that might happen"""
+    try:
+        pool = pool_class(dsn=dsn, name=database_name, **pool_configs)
+        await pool.init()
+        _pools[database_name] = pool
+    except Exception:
+        _logger.error(
+            f"Error initializing pool for database {env_var_name!r}, skipping", exc_info=True
+        )
+
+
 async def init() -> None:
-    """Init all the database pools"""
-    for env_var_name, env_var_value in os.environ.items():
-        if not env_var_name.startswith("DATABASE_"):
-            continue
+    """Init all the database pools concurrently"""
+    global _metrics_queue, _metrics_task
+    # The metrics queue and its logger are created here, so they're bound to the running loop
+    _metrics_queue = asyncio.Queue(maxsize=METRICS_QUEUE_SIZE)
+    _metrics_task = asyncio.create_task(_metrics_logger(_metrics_queue))
+
+    # Iterating the keys only decodes the values of the variables that are used
+    database_env_vars = [
+        (name, os.environ[name]) for name in os.environ if name.startswith("DATABASE_")
+    ]
 
-        dsn = env_var_value
-        pool_type = dsn.split("://")[0]
+    init_tasks = []
 
-        pool_class: type[Pool] | None
-        if pool_type in _pool_cache:
-            pool_class = _pool_cache[pool_type]
-        else:
-            pool_class = get_plugin_pool(pool_type)
+    for env_var_name, dsn in database_env_vars:
+        pool_type = dsn.partition("://")[0]
+
+        pool_class = _pool_cache.get(pool_type) or get_plugin_pool(pool_type)
 
         if pool_class is None:
             _logger.warning(f"Invalid DSN for database pool {env_var_name!r}")
@@ -47,44 +120,42 @@ async def init() -> None:
         _pool_cache[pool_type] = pool_class
 
         # Get the pool configs
-        database_name = env_var_name.split("DATABASE_")[1].lower()
+        database_name = env_var_name.removeprefix("DATABASE_").lower()
         pool_configs = configs.databases_pools_configs.get(database_name) or {}
 
-        try:
-            pool = pool_class(dsn=dsn, name=database_name, **pool_configs)
-            await pool.init()
-            _pools[database_name] = pool
-        except Exception:
-            _logger.error(
-                f"Error initializing pool for database {env_var_name!r}, skipping", exc_info=True
-            )
+        init_tasks.append(_init_pool(pool_class, env_var_name, dsn, database_name, pool_configs))
+
+    await asyncio.gather(*init_tasks)
 
 
 async def _fetch(
     fetch_task: Coroutine[Any, Any, list[dict[Any, Any]]],
-    metrics: dict[str, Any],
+    metrics: QueryMetrics,
 ) -> list[dict[Any, Any]] | None:
-    """Await a fetch coroutine, update the metrics and log them"""
+    """Await a fetch coroutine, update the metrics and queue them to be logged"""
     try:
         start_time = time.time()
-        metrics["start_time"] = start_time
+        metrics.start_time = start_time
         result = await fetch_task
-        metrics["status"] = QueryStatus.success.value
+        metrics.status = QueryStatus.success.value
         return cast(list[dict[Any, Any]] | None, result)
     except asyncio.CancelledError:
-        metrics["status"] = QueryStatus.canceled.value
+        metrics.status = QueryStatus.canceled.value
         return None
     except Exception as e:
         _logger.error(e)
-        metrics["status"] = QueryStatus.error.value
-        metrics["error"] = traceback.format_exc().strip()
+        metrics.status = QueryStatus.error.value
+        metrics.error = "".join(traceback.format_exception_only(e)).strip()
         raise e
     finally:
         end_time = time.time()
-        metrics["end_time"] = end_time
-        metrics["query_time"] = end_time - start_time
-        if configs.database_log_query_metrics:
-            _logger.info(json.dumps(metrics, default=str))
+        metrics.end_time = end_time
+        metrics.query_time = end_time - start_time
+        if configs.database_log_query_metrics and _metrics_queue is not None:
+            try:
+                _metrics_queue.put_nowait(metrics)
+            except asyncio.QueueFull:
+                _logger.warning("Query metrics queue is full, dropping metrics")
 
 
 async def query(
@@ -108,16 +179,7 @@ async def query(
         sql, *args, acquire_timeout=acquire_timeout, query_timeout=query_timeout
     )
 
-    metrics = {
-        "pool_name": name,
-        "query": sql,
-        "args": args,
-        "status": None,
-        "error": None,
-        "start_time": None,
-        "end_time": None,
-        "query_time": None,
-    }
+    metrics = QueryMetrics(pool_name=name, query=sql, args=args)
 
     return await _fetch(fetch_task, metrics)
 
@@ -143,20 +205,19 @@ async def query_application(
         sql, *args, acquire_timeout=acquire_timeout, query_timeout=query_timeout
     )
 
-    metrics = {
-        "pool_name": "application",
-        "query": sql,
-        "args": args,
-        "status": None,
-        "error": None,
-        "start_time": None,
-        "end_time": None,
-        "query_time": None,
-    }
+    metrics = QueryMetrics(pool_name="application", query=sql, args=args)
 
     return await _fetch(fetch_task, metrics)
 
 
 async def close() -> None:
     """Close all the database pools"""
+    global _metrics_queue, _metrics_task
+    if _metrics_task is not None:
+        _metrics_task.cancel()
+        _metrics_task = None
+    if _metrics_queue is not None:
+        _flush_metrics(_metrics_queue)
+        _metrics_queue = None
+
     await do_concurrently(*[pool.close() for pool in _pools.values()])
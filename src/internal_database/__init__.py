@@ -1,10 +1,19 @@
 from .check_database import check_database
-from .internal_database import CallbackSession, close, engine, get_session
+from .internal_database import (
+    CallbackSession,
+    close,
+    engine,
+    get_readonly_session,
+    get_session,
+    warmup,
+)
 
 __all__ = [
     "CallbackSession",
     "check_database",
     "close",
     "engine",
+    "get_readonly_session",
     "get_session",
+    "warmup",
 ]
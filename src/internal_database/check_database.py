@@ -1,6 +1,3 @@
-import alembic.config
-import alembic.runtime
-import alembic.script
 from sqlalchemy.engine.base import Connection
 
 import internal_database
@@ -9,6 +6,11 @@ from exceptions.database import PendingDatabaseUpgrade
 
 async def check_database() -> None:
     """Check the database for pending migrations."""
+    # Alembic is only used once at startup, so it's imported here to avoid loading it with the
+    # rest of the application modules
+    import alembic.config
+    import alembic.runtime.migration
+    import alembic.script
 
     def check_migration_revision(connection: Connection) -> None:
         alembic_config = alembic.config.Config("alembic.ini")
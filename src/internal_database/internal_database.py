@@ -1,30 +1,49 @@
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Coroutine
+from typing import AsyncGenerator, Coroutine
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from configs import configs
 from utils.async_tools import do_concurrently
+from utils.exception_handling import catch_exceptions
 
+_logger = logging.getLogger("internal_database")
 
-class CallbackSession(AsyncSession):
-    _callbacks: list[Coroutine[None, None, None]]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
-        self._callbacks = []
+class CallbackSession(AsyncSession):
+    # Most sessions don't have callbacks, so the list is only created when the first one is added
+    _callbacks: list[Coroutine[None, None, None]] | None = None
 
     def add_callback(self, callback: Coroutine[None, None, None] | None) -> None:
-        if callback is not None:
-            self._callbacks.append(callback)
+        if callback is None:
+            return
+        if self._callbacks is None:
+            self._callbacks = []
+        self._callbacks.append(callback)
 
     async def execute_callbacks(self) -> None:
+        if not self._callbacks:
+            return
+
+        if len(self._callbacks) == 1:
+            with catch_exceptions(_logger):
+                await self._callbacks[0]
+            return
+
         await do_concurrently(*self._callbacks)
 
     def cancel_callbacks(self) -> None:
+        if not self._callbacks:
+            return
+
+        # An error closing one of the callbacks shouldn't prevent the others from being closed
         for callback in self._callbacks:
-            callback.close()
+            with catch_exceptions(_logger):
+                callback.close()
+        self._callbacks.clear()
 
 
 engine = create_async_engine(
@@ -43,8 +62,8 @@ async def get_session() -> AsyncGenerator[CallbackSession, None]:
         async with session.begin():
             try:
                 yield session
-                # If the session is dirty, commit the changes and execute the callbacks
-                if session.dirty:
+                # If the session has any changes, commit them and execute the callbacks
+                if session.new or session.dirty or session.deleted:
                     await session.commit()
                 await session.execute_callbacks()
             except Exception:
@@ -53,5 +72,22 @@ async def get_session() -> AsyncGenerator[CallbackSession, None]:
                 raise
 
 
+@asynccontextmanager
+async def get_readonly_session() -> AsyncGenerator[CallbackSession, None]:
+    """Get a 'CallbackSession' session object to be used only to read data. The session doesn't
+    begin a transaction explicitly and nothing is committed when it's closed"""
+    async with async_session() as session:
+        yield session
+
+
+async def warmup() -> None:
+    """Open the pool connections beforehand, so the first sessions don't have to wait for the
+    connections to be created"""
+    connections = await asyncio.gather(
+        *[engine.connect().start() for _ in range(configs.application_database_settings.pool_size)]
+    )
+    await asyncio.gather(*[connection.close() for connection in connections])
+
+
 async def close() -> None:
     await engine.dispose(close=True)
@@ -25,7 +25,7 @@ import utils.app as app
 import utils.environment_variables as environment_variables
 import utils.log as log
 from exceptions import InitializationError, MonitorValidationError
-from utils.exception_handling import protected_task
+from utils.async_tools import do_concurrently
 
 CONTROLLER = "controller"
 EXECUTOR = "executor"
@@ -41,6 +41,7 @@ async def init(controller_enabled: bool, executor_enabled: bool) -> None:
 
     # Check database migrations
     await internal_database.check_database()
+    await internal_database.warmup()
 
     # Application startup
     app.setup()
@@ -65,24 +66,28 @@ async def init(controller_enabled: bool, executor_enabled: bool) -> None:
 
 async def finish(controller_enabled: bool, executor_enabled: bool) -> None:
     """Finish the application, making sure any exception won't impact other closing tasks"""
-    await protected_task(_logger, http_server.wait_stop())
-    await protected_task(_logger, databases.close())
-    await protected_task(_logger, internal_database.close())
-    await protected_task(
-        _logger,
+    # Stop receiving requests from the HTTP server and plugins services before closing the
+    # resources they use. Each step is independent from the others in the same group, so they can
+    # run at the same time
+    await do_concurrently(
+        http_server.wait_stop(),
         plugins.services.stop_plugin_services(controller_enabled, executor_enabled),
     )
+    await do_concurrently(
+        databases.close(),
+        message_queue.close(),
+        internal_database.close(),
+    )
 
 
 async def run(args: argparse.Namespace) -> None:
     """Initialize and create the tasks for Sentinela execution"""
-    operation_modes = set(args.modes) or {CONTROLLER, EXECUTOR}
+    operation_modes = frozenset(args.modes) or frozenset((CONTROLLER, EXECUTOR))
+    controller_enabled = CONTROLLER in operation_modes
+    executor_enabled = EXECUTOR in operation_modes
 
     try:
-        await init(
-            controller_enabled=CONTROLLER in operation_modes,
-            executor_enabled=EXECUTOR in operation_modes,
-        )
+        await init(controller_enabled=controller_enabled, executor_enabled=executor_enabled)
     except InitializationError as e:
         _logger.error("Failed to initialize")
         _logger.error(e)
@@ -103,10 +108,7 @@ async def run(args: argparse.Namespace) -> None:
 
     await task_manager.run()
 
-    await finish(
-        controller_enabled=CONTROLLER in operation_modes,
-        executor_enabled=EXECUTOR in operation_modes,
-    )
+    await finish(controller_enabled=controller_enabled, executor_enabled=executor_enabled)
 
 
 async def validate_monitor(args: argparse.Namespace) -> None:
@@ -223,4 +225,11 @@ async def main() -> None:
 
 
 def start() -> None:
-    asyncio.run(main())
+    # uvloop is optional and used as the event loop when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+
+    uvloop.run(main())
@@ -8,6 +8,31 @@ from .protocols import Message, Queue
 
 queue: Queue
 
+QUEUE_NOT_INITIALIZED_ERROR = "Message queue not initialized, 'init' must be called first"
+
+_QUEUE_METHODS = ("send_message", "get_message", "change_visibility", "delete_message")
+
+
+# The queue methods below are replaced by the queue's own methods when it's initialized
+async def send_message(type: str, payload: dict[str, Any]) -> None:
+    """Send a message to the queue"""
+    raise RuntimeError(QUEUE_NOT_INITIALIZED_ERROR)
+
+
+async def get_message() -> Message | None:
+    """Get a message from the queue"""
+    raise RuntimeError(QUEUE_NOT_INITIALIZED_ERROR)
+
+
+async def change_visibility(message: Message) -> None:
+    """Change the visibility time for a message in the queue"""
+    raise RuntimeError(QUEUE_NOT_INITIALIZED_ERROR)
+
+
+async def delete_message(message: Message) -> None:
+    """Delete a message from the queue"""
+    raise RuntimeError(QUEUE_NOT_INITIALIZED_ERROR)
+
 
 async def init() -> None:
     """Initialize the queue, identifying if it's internal or a queue from an installed plugin"""
@@ -36,38 +61,23 @@ async def init() -> None:
 
     await queue.init()
 
+    # Binding the methods once avoids going through the 'queue' global in every call
+    globals().update({method: getattr(queue, method) for method in _QUEUE_METHODS})
+
 
 def get_queue_wait_message_time() -> float:
     """Get the time to wait for a message in the queue"""
     return queue.queue_wait_message_time
 
 
-async def send_message(type: str, payload: dict[str, Any]) -> None:
-    """Send a message to the queue"""
-    global queue
-    return await queue.send_message(type, payload)
-
-
-async def get_message() -> Message | None:
-    """Get a message from the queue"""
-    global queue
-    return await queue.get_message()
-
-
-async def change_visibility(message: Message) -> None:
-    """Change the visibility time for a message in the queue"""
-    global queue
-    return await queue.change_visibility(message)
-
-
-async def delete_message(message: Message) -> None:
-    """Delete a message from the queue"""
-    global queue
-    return await queue.delete_message(message)
+async def close() -> None:
+    """Close the queue, releasing any resources it might be using"""
+    return await queue.close()
 
 
 __all__ = [
     "change_visibility",
+    "close",
     "delete_message",
     "get_message",
     "init",
@@ -1,11 +1,13 @@
 import asyncio
-import json
 import logging
+from collections import deque
 from typing import Any, Literal
 
 from pydantic.dataclasses import dataclass
 
+import utils.json_tools as json_tools
 from message_queue.protocols import Message
+from message_queue.serialization import serialize_message
 
 _logger = logging.getLogger("internal_queue")
 
@@ -18,19 +20,24 @@ class InternalQueueConfig:
 
 class InternalMessage:
     id: str = ""
-    message: dict[str, Any]
+    message: str
+    _content: dict[str, Any] | None = None
 
     def __init__(self, message: str) -> None:
-        self.message = json.loads(message)
+        self.message = message
 
     @property
     def content(self) -> dict[str, Any]:
-        return self.message
+        """Message content, decoded only when it's accessed for the first time"""
+        if self._content is None:
+            self._content = json_tools.loads(self.message)
+        return self._content
 
 
 class InternalQueue:
     _config: InternalQueueConfig
-    _queue: asyncio.Queue[str]
+    _queue: deque[str]
+    _new_message: asyncio.Event
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = InternalQueueConfig(**config)
@@ -42,28 +49,32 @@ class InternalQueue:
     async def init(self) -> None:
         """Setup the internal queue"""
         _logger.info("Internal queue setup")
-        self._queue = asyncio.Queue()
+        self._queue = deque()
+        self._new_message = asyncio.Event()
 
     async def send_message(self, type: str, payload: dict[str, Any]) -> None:
         """Send a message to the queue"""
-        await self._queue.put(
-            json.dumps(
-                {
-                    "type": type,
-                    "payload": payload,
-                }
-            )
-        )
+        self._queue.append(serialize_message(type, payload))
+        self._new_message.set()
 
     async def get_message(self) -> Message | None:
         """Get a message from the queue"""
+        # Only schedule the timeout if there're no messages available
+        if self._queue:
+            return InternalMessage(self._queue.popleft())
+
+        # Other consumers might be waiting for messages as well, so after being notified, check
+        # again if there's still a message available
         try:
-            return InternalMessage(
-                await asyncio.wait_for(self._queue.get(), self._config.queue_wait_message_time)
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(self._config.queue_wait_message_time):
+                while not self._queue:
+                    self._new_message.clear()
+                    await self._new_message.wait()
+        except TimeoutError:
             return None
 
+        return InternalMessage(self._queue.popleft())
+
     async def change_visibility(self, message: Message) -> None:
         """Not implemented in internal queue"""
         pass
@@ -71,3 +82,7 @@ class InternalQueue:
     async def delete_message(self, message: Message) -> None:
         """Not implemented in internal queue"""
         pass
+
+    async def close(self) -> None:
+        """Not implemented in internal queue"""
+        pass
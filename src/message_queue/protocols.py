@@ -24,3 +24,5 @@ class Queue(Protocol):  # pragma: no cover
     async def change_visibility(self, message: Message) -> None: ...
 
     async def delete_message(self, message: Message) -> None: ...
+
+    async def close(self) -> None: ...
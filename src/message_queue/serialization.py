@@ -0,0 +1,16 @@
+from functools import cache
+from typing import Any
+
+import utils.json_tools as json_tools
+
+
+@cache
+def _message_prefix(type: str) -> str:
+    """Get the beginning of the serialized message for the message type. There're only a few
+    message types, so the prefixes are built only once for each one"""
+    return f'{{"type":{json_tools.dumps(type)},"payload":'
+
+
+def serialize_message(type: str, payload: dict[str, Any]) -> str:
+    """Serialize a message with its type and payload to a JSON string"""
+    return _message_prefix(type) + json_tools.dumps(payload) + "}"
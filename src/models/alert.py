@@ -1,14 +1,14 @@
 import enum
 from datetime import datetime
-from typing import Sequence
+from typing import Any, Sequence
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, Row, lambda_stmt, select
 from sqlalchemy.orm import Mapped, mapped_column
 
 import models.utils.priority as priority_utils
 from data_models.monitor_options import AgeRule, AlertOptions, CountRule, IssueOptions, ValueRule
+from internal_database import get_session
 from registry import get_monitor_module
-from utils.async_tools import do_concurrently
 from utils.time import now
 
 from .base import Base
@@ -53,7 +53,14 @@ class Alert(Base):
     @property
     async def active_issues(self) -> Sequence[Issue]:
         """Get all the active issues linked to the alert"""
-        return await Issue.get_all(Issue.alert_id == self.id, Issue.status == IssueStatus.active)
+        alert_id = self.id
+        return await Issue.get_all_from_statement(
+            lambda_stmt(
+                lambda: select(Issue).where(
+                    Issue.alert_id == alert_id, Issue.status == IssueStatus.active
+                )
+            )
+        )
 
     @property
     def is_priority_acknowledged(self) -> bool:
@@ -81,14 +88,26 @@ class Alert(Base):
 
     @staticmethod
     def calculate_priority(
-        rule: AgeRule | CountRule | ValueRule, issues: list[Issue] | Sequence[Issue]
+        rule: AgeRule | CountRule | ValueRule, issues: priority_utils.IssuesSequence
     ) -> int | None:
         """Calculate the alert priority for the provided rule and issues"""
         return priority_utils.calculate_priority(rule=rule, issues=issues)
 
+    async def get_active_issues_rows(
+        self, rule: AgeRule | CountRule | ValueRule
+    ) -> Sequence[Row[Any]]:
+        """Get the alert's active issues, loading only the columns used by the priority rule"""
+        return await Issue.get_raw(
+            columns=priority_utils.get_rule_columns(rule),
+            column_filters=[Issue.alert_id == self.id, Issue.status == IssueStatus.active],
+        )
+
     @Base.lock_change
-    async def update_priority(self) -> None:
-        """Update the alert priority from it's rule and active issues"""
+    async def update_priority(
+        self, active_issues: priority_utils.IssuesSequence | None = None
+    ) -> None:
+        """Update the alert priority from it's rule and active issues. If the active issues were
+        already loaded, they can be provided to avoid loading them again"""
         if self.options is None:
             self._logger.warning(
                 "Updating alert priority is not possible without an 'AlertOptions' setting"
@@ -97,9 +116,12 @@ class Alert(Base):
 
         previous_priority = self.priority
 
-        new_priority = self.calculate_priority(
-            rule=self.options.rule, issues=await self.active_issues
-        )
+        issues: priority_utils.IssuesSequence
+        if active_issues is None:
+            issues = await self.get_active_issues_rows(self.options.rule)
+        else:
+            issues = active_issues
+        new_priority = self.calculate_priority(rule=self.options.rule, issues=issues)
 
         if new_priority is None:
             new_priority = priority_utils.AlertPriority.low
@@ -138,7 +160,10 @@ class Alert(Base):
         if len(issues) == 0:
             return
 
-        await do_concurrently(*[issue.link_to_alert(self) for issue in issues])
+        # Link all the issues in a single transaction
+        async with get_session() as session:
+            for issue in issues:
+                await issue.link_to_alert(self, session=session)
 
         if self.options and self.options.dismiss_acknowledge_on_new_issues:
             await self.dismiss_acknowledge()
@@ -219,16 +244,20 @@ class Alert(Base):
 
         self._logger.debug("Unlocked")
 
-    async def update(self) -> None:
+    async def update(self, active_issues_count: int | None = None) -> None:
         """Update the alert, checking if it's solved and queueing an 'alert_updated' event for the
-        monitor's notifications"""
+        monitor's notifications. If the active issues were already loaded, their count can be
+        provided to avoid counting them again"""
         if self.status != AlertStatus.active:
             self._logger.info(f"Can't update, status is {self.status.value!r}")
             return
 
-        issues_count = await Issue.count(
-            Issue.alert_id == self.id, Issue.status == IssueStatus.active
-        )
+        if active_issues_count is None:
+            issues_count = await Issue.count(
+                Issue.alert_id == self.id, Issue.status == IssueStatus.active
+            )
+        else:
+            issues_count = active_issues_count
         if issues_count == 0:
             await self.solve()
         else:
@@ -245,7 +274,10 @@ class Alert(Base):
             self._logger.info("Tried to solve an alert with solvable issues, skipping")
             return
 
-        await do_concurrently(*[issue.solve() for issue in await self.active_issues])
+        # Solve all the issues in a single transaction
+        async with get_session() as session:
+            for issue in await self.active_issues:
+                await issue.solve(session=session)
 
         await self.acknowledge(send_event=False)
         await self.update()
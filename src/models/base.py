@@ -1,25 +1,33 @@
-import json
 import logging
 from asyncio import Semaphore
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import Any, Callable, Coroutine, Optional, Sequence, Type, TypeVar, cast
 
 from sqlalchemy import Row, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute
 from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 import message_queue as message_queue
+import utils.json_tools as json_tools
 from configs import configs
-from internal_database import CallbackSession, get_session
-from registry import get_monitor_module
+from internal_database import CallbackSession, get_readonly_session, get_session
+from registry import get_monitor_module, get_monitor_reaction_events
 from utils.async_tools import do_concurrently
 
 from .event import Event
 
+# Types of the columns' values that don't need to be formatted, checked before the 'isinstance'
+# checks as most of the values are of these types
+_PLAIN_TYPES = frozenset((int, float, str, bool, dict, list, type(None)))
+
 
 def format_value(value: Any) -> Any:
+    if type(value) in _PLAIN_TYPES:
+        return value
     if isinstance(value, datetime):
         return value.isoformat()
     if isinstance(value, Enum):
@@ -27,6 +35,13 @@ def format_value(value: Any) -> Any:
     return value
 
 
+@cache
+def _get_columns_keys(model_class: type[Any]) -> tuple[str, ...]:
+    """Get the keys of the model's columns. The columns don't change, so each model is inspected
+    only once"""
+    return tuple(column.key for column in inspect(model_class).column_attrs)
+
+
 ClassType = TypeVar("ClassType")
 
 
@@ -38,6 +53,17 @@ class Base(AsyncAttrs, DeclarativeBase):
     _lock_semaphore_obj: Semaphore
 
     _enable_creation_event: bool = True
+    _class_name_lower: str
+    _created_event_name: str
+    _has_post_create: bool
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the class name strings used by the events and check if the model implements the
+        '_post_create' method only once for each model"""
+        super().__init_subclass__(**kwargs)
+        cls._class_name_lower = cls.__name__.lower()
+        cls._created_event_name = f"{cls._class_name_lower}_created"
+        cls._has_post_create = cls._post_create is not Base._post_create
 
     @classmethod
     def _class_name(cls) -> str:
@@ -69,55 +95,63 @@ class Base(AsyncAttrs, DeclarativeBase):
 
     def _should_queue_event(self, event_name: str) -> bool:
         """Check if the event should be queued based on the monitor's 'reaction_options' settings"""
-        monitor_code = get_monitor_module(self.monitor_id)  # type: ignore[attr-defined]
-        try:
-            reactions_list = monitor_code.reaction_options[event_name]
-            return len(reactions_list) > 0
-        except AttributeError:
-            return False
+        monitor_id = self.monitor_id  # type: ignore[attr-defined]
+        return event_name in get_monitor_reaction_events(monitor_id)
 
     def _build_event_payload(
         self, event_name: str, extra_payload: dict[str, Any] | None
     ) -> dict[str, Any]:
         return {
-            "event_source": self._class_name().lower(),
+            "event_source": self._class_name_lower,
             "event_source_id": self.id,  # type: ignore[attr-defined]
             "event_source_monitor_id": self.monitor_id,  # type: ignore[attr-defined]
             "event_name": event_name,
             "event_data": {
-                column.key: format_value(column.value) for column in inspect(self).attrs
+                key: format_value(getattr(self, key)) for key in _get_columns_keys(type(self))
             },
             "extra_payload": extra_payload,
         }
 
+    def _should_save_event(self) -> bool:
+        """Check if the event should be saved based on the 'save_events_mode' setting"""
+        if configs.save_events_mode == "all":
+            return True
+        if configs.save_events_mode == "monitor":
+            monitor_module = get_monitor_module(self.monitor_id)  # type: ignore[attr-defined]
+            return monitor_module.monitor_options.save_events
+        return False
+
     async def _save_event(self, event_payload: dict[str, Any]) -> None:
-        monitor_module = get_monitor_module(self.monitor_id)  # type: ignore[attr-defined]
-        save_conditions = (
-            configs.save_events_mode == "all",
-            configs.save_events_mode == "monitor" and monitor_module.monitor_options.save_events,
+        await Event.create(
+            name=event_payload["event_name"],
+            monitor_id=event_payload["event_source_monitor_id"],
+            source=event_payload["event_source"],
+            source_id=event_payload["event_source_id"],
+            data=event_payload["event_data"],
+            extra_payload=event_payload["extra_payload"],
         )
-        if any(save_conditions):
-            await Event.create(
-                name=event_payload["event_name"],
-                monitor_id=event_payload["event_source_monitor_id"],
-                source=event_payload["event_source"],
-                source_id=event_payload["event_source_id"],
-                data=event_payload["event_data"],
-                extra_payload=event_payload["extra_payload"],
-            )
 
     async def _create_event(
         self, event_name: str, extra_payload: dict[str, Any] | None = None
     ) -> None:
         """Check if the event has an reaction registered to it and, if does, queue the event"""
+        should_queue = self._should_queue_event(event_name)
+        should_log = should_queue or configs.log_all_events
+        should_save = self._should_save_event()
+
+        # Building the payload reads every column of the instance, so it's skipped when the event
+        # won't be queued, logged or saved
+        if not (should_log or should_save):
+            return
+
         event_payload = self._build_event_payload(event_name, extra_payload)
 
-        if self._should_queue_event(event_name):
-            self._logger.info(json.dumps(event_payload))
+        if should_log and self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(json_tools.dumps(event_payload))
+        if should_queue:
             await message_queue.send_message(type="event", payload=event_payload)
-        elif configs.log_all_events:
-            self._logger.info(json.dumps(event_payload))
-        await self._save_event(event_payload)
+        if should_save:
+            await self._save_event(event_payload)
 
     @property
     def _logger(self) -> logging.Logger:
@@ -142,11 +176,11 @@ class Base(AsyncAttrs, DeclarativeBase):
 
     @classmethod
     async def count(cls: Type[ClassType], *column_filters: ColumnElement[Any]) -> int:
-        async with get_session() as session:
+        async with get_readonly_session() as session:
             result = await session.execute(
                 select(func.count(cls.id)).where(*column_filters)  # type: ignore[attr-defined]
             )
-            return cast(int, result.scalars().first())
+            return cast(int, result.scalar_one())
 
     @classmethod
     async def create_batch(cls: Type[ClassType], instances: list[ClassType]) -> list[ClassType]:
@@ -156,14 +190,16 @@ class Base(AsyncAttrs, DeclarativeBase):
             session.add_all(instances)
             await session.commit()
 
-        await do_concurrently(
-            *[instance._post_create() for instance in instances]  # type: ignore[attr-defined]
-        )
+        # Skip creating a task for each instance when the model doesn't implement '_post_create'
+        if cls._has_post_create:  # type: ignore[attr-defined]
+            await do_concurrently(
+                *[instance._post_create() for instance in instances]  # type: ignore[attr-defined]
+            )
 
         await do_concurrently(
             *[
                 instance._create_event(  # type: ignore[attr-defined]
-                    event_name=f"{cls._class_name().lower()}_created"  # type: ignore[attr-defined]
+                    event_name=cls._created_event_name  # type: ignore[attr-defined]
                 )
                 for instance in instances
                 if instance._enable_creation_event  # type: ignore[attr-defined]
@@ -185,7 +221,7 @@ class Base(AsyncAttrs, DeclarativeBase):
 
         if instance._enable_creation_event:  # type: ignore[attr-defined]
             await instance._create_event(  # type: ignore[attr-defined]
-                event_name=f"{cls._class_name().lower()}_created"  # type: ignore[attr-defined]
+                event_name=cls._created_event_name  # type: ignore[attr-defined]
             )
         return instance
 
@@ -193,7 +229,7 @@ class Base(AsyncAttrs, DeclarativeBase):
     async def get(cls: Type[ClassType], *column_filters: ColumnElement[Any]) -> ClassType | None:
         """Return an instance of the model that matches the provided filters or 'None' if none was
         found"""
-        async with get_session() as session:
+        async with get_readonly_session() as session:
             result = await session.execute(select(cls).where(*column_filters))
             return result.scalars().first()
 
@@ -208,7 +244,7 @@ class Base(AsyncAttrs, DeclarativeBase):
         if column_filters is None:
             column_filters = []
 
-        async with get_session() as session:
+        async with get_readonly_session() as session:
             result = await session.execute(select(*columns).where(*column_filters))
             return result.all()
 
@@ -216,7 +252,7 @@ class Base(AsyncAttrs, DeclarativeBase):
     async def get_by_id(cls: Type[ClassType], instance_id: int) -> ClassType | None:
         """Return an instance of the model that has the provided primary key or 'None' if none was
         found"""
-        async with get_session() as session:
+        async with get_readonly_session() as session:
             return await session.get(cls, ident=instance_id)
 
     @classmethod
@@ -234,7 +270,18 @@ class Base(AsyncAttrs, DeclarativeBase):
         if limit is not None:
             statement = statement.limit(limit)
 
-        async with get_session() as session:
+        async with get_readonly_session() as session:
+            result = await session.execute(statement)
+            return result.scalars().all()
+
+    @classmethod
+    async def get_all_from_statement(
+        cls: Type[ClassType], statement: StatementLambdaElement
+    ) -> Sequence[ClassType]:
+        """Return all instances selected by the provided lambda statement. Lambda statements are
+        built and compiled only once, changing only their parameters, so they should be used for
+        queries that are executed frequently"""
+        async with get_readonly_session() as session:
             result = await session.execute(statement)
             return result.scalars().all()
 
@@ -254,7 +301,7 @@ class Base(AsyncAttrs, DeclarativeBase):
 
     async def refresh(self, attribute_names: Optional[list[str] | None] = None) -> None:
         """Reload the instance's attributes from the database"""
-        async with self._semaphore, get_session() as session:
+        async with self._semaphore, get_readonly_session() as session:
             session.add(self)
             await session.refresh(self, attribute_names)
 
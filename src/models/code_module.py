@@ -3,8 +3,8 @@ from typing import Sequence
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm.attributes import flag_modified
 
 from .base import Base
 
@@ -16,7 +16,7 @@ class CodeModule(Base):
     monitor_id: Mapped[int] = mapped_column(ForeignKey("Monitors.id"))
     code: Mapped[str] = mapped_column(String(), nullable=True)
     additional_files: Mapped[dict[str, str]] = mapped_column(
-        MutableDict.as_mutable(postgresql.JSONB),  # type: ignore[arg-type]
+        postgresql.JSONB,
         nullable=True,
     )
     registered_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -46,6 +46,8 @@ class CodeModule(Base):
     async def register(self, code: str, additional_files: dict[str, str] | None = None) -> None:
         """Register a code module with the given code and additional files"""
         self.code = code
+        # Registering the module again with the same files dict isn't detected as a change
         self.additional_files = additional_files or {}
+        flag_modified(self, "additional_files")
         self.registered_at = datetime.now()
         await self.save()
@@ -4,7 +4,6 @@ from typing import Any, Type, TypeVar
 from sqlalchemy import DateTime, Integer, String
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncAttrs
-from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from internal_database import get_session
@@ -26,12 +25,8 @@ class Event(Base):
     monitor_id: Mapped[int] = mapped_column(Integer())
     source: Mapped[str] = mapped_column(String(32))
     source_id: Mapped[int] = mapped_column(Integer())
-    data: Mapped[dict[str, Any]] = mapped_column(
-        MutableDict.as_mutable(postgresql.JSONB)  # type: ignore[arg-type]
-    )
-    extra_payload: Mapped[dict[str, Any]] = mapped_column(
-        MutableDict.as_mutable(postgresql.JSONB)  # type: ignore[arg-type]
-    )
+    data: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB)
+    extra_payload: Mapped[dict[str, Any]] = mapped_column(postgresql.JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), insert_default=now)
 
     @classmethod
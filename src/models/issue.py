@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import enum
-import json
+import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, any_, bindparam
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm.attributes import flag_modified
 
+import utils.json_tools as json_tools
 from data_models.monitor_options import IssueOptions
 from internal_database import CallbackSession
 from registry import get_monitor_module
@@ -37,19 +38,28 @@ class Issue(Base):
     status: Mapped[IssueStatus] = mapped_column(
         Enum(IssueStatus, native_enum=False), insert_default=IssueStatus.active
     )
-    data: Mapped[dict[Any, Any]] = mapped_column(
-        MutableDict.as_mutable(postgresql.JSONB)  # type: ignore[arg-type]
-    )
+    data: Mapped[dict[Any, Any]] = mapped_column(postgresql.JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), insert_default=now)
     solved_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     dropped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
     @staticmethod
-    async def is_unique(monitor_id: int, model_id: str) -> bool:
-        """Returns a boolean indicating if the provided monitor already has an issue with the
-        provided 'model_id'"""
-        issue = await Issue.get(Issue.monitor_id == monitor_id, Issue.model_id == model_id)
-        return issue is None
+    async def get_existing_model_ids(monitor_id: int, model_ids: list[str]) -> set[str]:
+        """Returns the set of the provided 'model_ids' that the monitor already has issues for,
+        using a single query for all of them"""
+        if len(model_ids) == 0:
+            return set()
+
+        # The ids are sent as a single array parameter, as the number of ids can be large
+        existing_issues = await Issue.get_raw(
+            columns=[Issue.model_id],
+            column_filters=[
+                Issue.monitor_id == monitor_id,
+                Issue.model_id
+                == any_(bindparam("model_ids", model_ids, type_=postgresql.ARRAY(String()))),
+            ],
+        )
+        return {model_id for (model_id,) in existing_issues}
 
     @property
     def options(self) -> IssueOptions:
@@ -60,12 +70,11 @@ class Issue(Base):
     def is_solved(self) -> bool:
         """Returns a boolean if the issue is solved using the monitor's 'is_solved' function. If
         the monitor's 'issue_options.solvable' is 'False', return 'False'"""
-        if not get_monitor_module(self.monitor_id).issue_options.solvable:
+        monitor_module = get_monitor_module(self.monitor_id)
+        if not monitor_module.issue_options.solvable:
             return False
 
-        return get_monitor_module(self.monitor_id).is_solved(
-            issue_data=self.data  # type: ignore[arg-type]
-        )
+        return monitor_module.is_solved(issue_data=self.data)  # type: ignore[arg-type]
 
     async def _link_to_alert_callback(self) -> None:
         """Callback of the 'link_to_alert' method that queues the event"""
@@ -130,7 +139,8 @@ class Issue(Base):
             await self._create_event("issue_updated_solved")
         else:
             await self._create_event("issue_updated_not_solved")
-        self._logger.debug(f"Data updated to {json.dumps(self.data)!r}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Data updated to {json_tools.dumps(self.data)!r}")
 
     @Base.lock_change
     async def update_data(
@@ -141,5 +151,8 @@ class Issue(Base):
             self._logger.info(f"Can't update, status is {self.status.value!r}")
             return
 
+        # The column isn't tracked as mutable, so the change is flagged explicitly, as the new data
+        # might be the same object as the current one
         self.data = new_data
+        flag_modified(self, "data")
         await self.save(session=session, callback=self._update_data_callback())
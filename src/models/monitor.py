@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Callable, Coroutine
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import Boolean, DateTime, Integer, String, event, lambda_stmt, select
 from sqlalchemy.orm import Mapped, mapped_column, reconstructor
 
 import message_queue
@@ -100,9 +102,11 @@ class Monitor(Base):
             return False
         return self._is_triggered(self.options.update_cron, self.update_executed_at)
 
-    @property
+    @cached_property
     def code(self) -> MonitorModule:
-        """Return the monitor's code registered in the 'monitors' module"""
+        """Return the monitor's code registered in the 'monitors' module. The module is cached in
+        the instance, as the options are accessed many times during a single execution, and the
+        cache is cleared when the instance is refreshed or expired"""
         return get_monitor_module(self.id)
 
     @property
@@ -155,20 +159,42 @@ class Monitor(Base):
 
     async def load_active_issues(self) -> None:
         """Load all the monitor's active issues and store them in the 'active_issues' attribute"""
+        monitor_id = self.id
         self.active_issues: list[Issue] = list(
-            await Issue.get_all(Issue.monitor_id == self.id, Issue.status == IssueStatus.active)
+            await Issue.get_all_from_statement(
+                lambda_stmt(
+                    lambda: select(Issue).where(
+                        Issue.monitor_id == monitor_id, Issue.status == IssueStatus.active
+                    )
+                )
+            )
         )
 
     async def load_active_alerts(self) -> None:
         """Load all the monitor's active alerts and store them in the 'active_alerts' attribute"""
+        monitor_id = self.id
         self.active_alerts: list[Alert] = list(
-            await Alert.get_all(Alert.monitor_id == self.id, Alert.status == AlertStatus.active)
+            await Alert.get_all_from_statement(
+                lambda_stmt(
+                    lambda: select(Alert).where(
+                        Alert.monitor_id == monitor_id, Alert.status == AlertStatus.active
+                    )
+                )
+            )
         )
 
     async def load(self) -> None:
         """Load all the monitor's active issues and alerts"""
-        await self.load_active_issues()
-        await self.load_active_alerts()
+        # The queries are independent, so they run at the same time using different connections. If
+        # one of them fails, the other one is cancelled
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(self.load_active_issues())
+                task_group.create_task(self.load_active_alerts())
+        except ExceptionGroup as e:
+            # The error is raised unwrapped, to be handled like the errors from other routines,
+            # while the group is kept as its context
+            raise e.exceptions[0]
 
     async def process(self) -> None:
         """Check if the monitor triggers any task and queue them if there're any"""
@@ -286,3 +312,13 @@ class Monitor(Base):
         """Clear the monitor's 'active_issues' and 'active_alerts' lists attributes"""
         self.active_issues.clear()
         self.active_alerts.clear()
+
+
+def _clear_code_cache(monitor: Monitor, *args: Any) -> None:
+    """Clear the monitor's cached code, as the monitor might've been registered again with a new
+    module"""
+    monitor.__dict__.pop("code", None)
+
+
+event.listen(Monitor, "refresh", _clear_code_cache)
+event.listen(Monitor, "expire", _clear_code_cache)
@@ -4,9 +4,9 @@ from typing import Any
 
 from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column
 
+from internal_database import CallbackSession
 from utils.time import now
 
 from .base import Base
@@ -27,19 +27,18 @@ class Notification(Base):
     status: Mapped[NotificationStatus] = mapped_column(
         Enum(NotificationStatus, native_enum=False), insert_default=NotificationStatus.active
     )
-    data: Mapped[dict[Any, Any]] = mapped_column(
-        MutableDict.as_mutable(postgresql.JSONB),  # type: ignore[arg-type]
-        nullable=True,
-    )
+    data: Mapped[dict[Any, Any]] = mapped_column(postgresql.JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), insert_default=now)
     closed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    async def _close_callback(self) -> None:
+        """Callback of the 'close' method that queues the event"""
+        await self._create_event("notification_closed")
+        self._logger.debug("Closed")
+
     @Base.lock_change
-    async def close(self) -> None:
+    async def close(self, session: CallbackSession | None = None) -> None:
         self.status = NotificationStatus.closed
         self.closed_at = now()
 
-        await self.save()
-
-        await self._create_event("notification_closed")
-        self._logger.debug("Closed")
+        await self.save(session=session, callback=self._close_callback())
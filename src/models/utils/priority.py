@@ -1,16 +1,38 @@
 import enum
-from typing import Callable, Sequence, cast
+import operator
+from typing import Any, Callable, Sequence
 
-from data_models.monitor_options import AgeRule, CountRule, ValueRule
+from sqlalchemy import Row
+from sqlalchemy.orm import InstrumentedAttribute
+
+from data_models.monitor_options import AgeRule, CountRule, PriorityLevels, ValueRule
 from models.issue import Issue
-from utils.time import time_since
+from utils.time import now, time_since
 
 _operators: dict[str, Callable[[int | float, int | float], bool]] = {
-    "greater_than": lambda a, b: a > b,
-    "lesser_than": lambda a, b: a < b,
+    "greater_than": operator.gt,
+    "lesser_than": operator.lt,
+}
+
+# For each operation, the value that triggers the highest priority if any value triggers it
+_extreme_value_functions: dict[str, Callable[..., int | float | None]] = {
+    "greater_than": max,
+    "lesser_than": min,
 }
 
 
+# Issues columns used by each rule, so only them are loaded when calculating the priority
+_rules_columns: dict[type, list[InstrumentedAttribute[Any]]] = {
+    AgeRule: [Issue.created_at],
+    CountRule: [Issue.id],
+    ValueRule: [Issue.data],
+}
+
+# Issues can be provided as 'Issue' instances or as rows with only the columns used by the rule,
+# as returned by 'get_rule_columns'
+IssuesSequence = Sequence[Issue] | Sequence[Row[Any]]
+
+
 class AlertPriority(enum.IntEnum):
     """Alert priority levels"""
 
@@ -21,63 +43,66 @@ class AlertPriority(enum.IntEnum):
     informational = 5
 
 
-def _calculate_age_rule(rule: AgeRule, issues: list[Issue] | Sequence[Issue]) -> int | None:
-    """Calculate the priority based on the issues' ages"""
-    issues_ages = [time_since(issue.created_at) for issue in issues]
+_priorities_by_name = {priority.name: priority for priority in AlertPriority}
 
-    for priority in sorted(AlertPriority):
-        reference_value = rule.priority_levels[priority.name]
 
-        if reference_value is None:
-            continue
-
-        for issue_age in issues_ages:
-            if issue_age > reference_value:
-                return priority
+def _get_triggered_priority(
+    value: int | float,
+    priority_levels: PriorityLevels,
+    compare: Callable[[int | float, int | float], bool] = operator.gt,
+) -> int | None:
+    """Get the highest priority that has its level triggered by the provided value"""
+    for priority_name, reference_value in priority_levels.sorted_levels:
+        if compare(value, reference_value):
+            return _priorities_by_name[priority_name]
 
     return None
 
 
-def _calculate_count_rule(rule: CountRule, issues: list[Issue] | Sequence[Issue]) -> int | None:
-    """Calculate the priority based on the number of issues"""
-    count = len(issues)
+def _calculate_age_rule(rule: AgeRule, issues: IssuesSequence) -> int | None:
+    """Calculate the priority based on the issues' ages. A priority is triggered by any issue older
+    than its level, so only the oldest issue's age is compared to the levels"""
+    reference = now()
+    oldest_issue_age = max(
+        (time_since(issue.created_at, reference) for issue in issues), default=None
+    )
 
-    for priority in sorted(AlertPriority):
-        reference_value = rule.priority_levels[priority.name]
+    if oldest_issue_age is None:
+        return None
 
-        if reference_value is None:
-            continue
+    return _get_triggered_priority(oldest_issue_age, rule.priority_levels)
 
-        if count > reference_value:
-            return priority
 
-    return None
+def _calculate_count_rule(rule: CountRule, issues: IssuesSequence) -> int | None:
+    """Calculate the priority based on the number of issues"""
+    return _get_triggered_priority(len(issues), rule.priority_levels)
 
 
-def _calculate_value_rule(rule: ValueRule, issues: list[Issue] | Sequence[Issue]) -> int | None:
+def _calculate_value_rule(rule: ValueRule, issues: IssuesSequence) -> int | None:
     """Calculate the priority based on a value in the issues' data field. The highest priority is
     triggered when at least 1 issue has the 'value' of the provided 'value_key' above or below the
-    priority value, based to the 'operation' parameter"""
-    issues_values = cast(list[int | float], [issue.data.get(rule.value_key) for issue in issues])
-    operator = _operators[rule.operation]
+    priority value, based to the 'operation' parameter. Issues without the 'value_key' in their
+    data are ignored"""
+    issues_values: list[int | float] = [
+        value for issue in issues if (value := issue.data.get(rule.value_key)) is not None
+    ]
+    # Only the most extreme value needs to be compared, as it's the first to trigger each priority
+    extreme_value = _extreme_value_functions[rule.operation](issues_values, default=None)
 
-    for priority in sorted(AlertPriority):
-        reference_value = rule.priority_levels[priority.name]
+    if extreme_value is None:
+        return None
 
-        if reference_value is None:
-            continue
+    return _get_triggered_priority(
+        extreme_value, rule.priority_levels, compare=_operators[rule.operation]
+    )
 
-        for issue_value in issues_values:
-            priority_triggered = operator(issue_value, reference_value)
-            if priority_triggered:
-                return priority
 
-    return None
+def get_rule_columns(rule: AgeRule | CountRule | ValueRule) -> list[InstrumentedAttribute[Any]]:
+    """Get the issues' columns used by the rule to calculate the priority"""
+    return _rules_columns[type(rule)]
 
 
-def calculate_priority(
-    rule: AgeRule | CountRule | ValueRule, issues: list[Issue] | Sequence[Issue]
-) -> int | None:
+def calculate_priority(rule: AgeRule | CountRule | ValueRule, issues: IssuesSequence) -> int | None:
     """Calculate the priority based on the rule and the provided issues"""
     if isinstance(rule, AgeRule):
         return _calculate_age_rule(rule, issues)
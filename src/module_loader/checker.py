@@ -27,6 +27,10 @@ ERROR_FUNCTION_MUST_HAVE_NO_ARGUMENTS = "'{display_name}' function must have no
 ERROR_FUNCTION_WRONG_ARGUMENTS = "'{display_name}' function must have arguments '{expected_args}'"
 ERROR_FUNCTION_WRONG_RETURN_TYPE = "'{display_name}' function must return '{expected_type}'"
 
+ISSUES_DATA_LIST_TYPE_PATTERN = re.compile(r"list\[[\w.<>]+.IssueDataType\]")
+OPTIONAL_ISSUES_DATA_LIST_TYPE_PATTERN = re.compile(r"list\[[\w.<>]+.IssueDataType\] \| None")
+ISSUE_DATA_TYPE_PATTERN = re.compile(r"<class '[\w.<>]+.IssueDataType'>")
+
 
 def _check_async_function(
     function: Callable[..., Any], display_name: Optional[str] = None
@@ -282,7 +286,7 @@ def _check_search_function(module: ModuleType) -> list[str]:
 
     # Check return type
     return_type_str = str(function_args.annotations["return"])
-    if not re.match(r"list\[[\w.<>]+.IssueDataType\] \| None", return_type_str):
+    if not OPTIONAL_ISSUES_DATA_LIST_TYPE_PATTERN.match(return_type_str):
         errors.append(
             ERROR_FUNCTION_WRONG_RETURN_TYPE.format(
                 display_name="search", expected_type="list[IssueDataType] | None"
@@ -328,7 +332,7 @@ def _check_update_function(module: ModuleType) -> list[str]:
 
     # Check the 'issues_data' argument type
     issues_data_argument_type_str = str(function_args.annotations["issues_data"])
-    if not re.match(r"list\[[\w.<>]+.IssueDataType\]", issues_data_argument_type_str):
+    if not ISSUES_DATA_LIST_TYPE_PATTERN.match(issues_data_argument_type_str):
         errors.append(
             ERROR_FUNCTION_WRONG_ARGUMENTS.format(
                 display_name="update", expected_args="issues_data: list[IssueDataType]"
@@ -347,7 +351,7 @@ def _check_update_function(module: ModuleType) -> list[str]:
 
     # Check return type
     return_type_str = str(function_args.annotations["return"])
-    if not re.match(r"list\[[\w.<>]+.IssueDataType\] \| None", return_type_str):
+    if not OPTIONAL_ISSUES_DATA_LIST_TYPE_PATTERN.match(return_type_str):
         errors.append(
             ERROR_FUNCTION_WRONG_RETURN_TYPE.format(
                 display_name="update", expected_type="list[IssueDataType] | None"
@@ -402,7 +406,7 @@ def _check_is_solved_function(module: ModuleType) -> list[str]:
 
     # Check the 'issue_data' argument type
     issue_data_argument_type_str = str(function_args.annotations["issue_data"])
-    if not re.match(r"<class '[\w.<>]+.IssueDataType'>", issue_data_argument_type_str):
+    if not ISSUE_DATA_TYPE_PATTERN.match(issue_data_argument_type_str):
         errors.append(
             ERROR_FUNCTION_WRONG_ARGUMENTS.format(
                 display_name="is_solved", expected_args="issue_data: IssueDataType"
@@ -51,19 +51,17 @@ def create_module_files(
     module_base_path = base_module_path / module_name
     os.makedirs(module_base_path, exist_ok=True)
     init_file = module_base_path / "__init__.py"
-    init_file.touch()
+    if not init_file.exists():
+        init_file.touch()
 
     # Write the code file
     module_path = module_base_path / f"{module_name}.py"
-    with open(module_path, "w") as temp_module:
-        temp_module.write(module_code)
+    module_path.write_text(module_code)
 
     # Write the additional files
     if additional_files is not None:
         for file_name, file_content in additional_files.items():
-            file_path = module_base_path / file_name
-            with open(file_path, "w") as file:
-                file.write(file_content)
+            (module_base_path / file_name).write_text(file_content)
 
     # Return the path relative to "src" as it's the path used to import the module
     return module_path.relative_to(RELATIVE_PATH)
@@ -1,15 +1,16 @@
-import traceback
+import sys
 from pathlib import Path
 from typing import Any
 
 
 def read_file(file_name: str, mode: str = "r") -> Any:
     """Read a file relative to where the function was called"""
-    if mode not in ["r", "rb"]:
+    if mode not in ("r", "rb"):
         raise ValueError("Only 'r' and 'rb' modes are allowed")
 
-    stack = traceback.extract_stack()
-    file_path = Path(stack[-2].filename).parent / file_name
+    # Only the caller's frame is needed, so the rest of the stack isn't extracted
+    caller_file_name = sys._getframe(1).f_code.co_filename
+    file_path = Path(caller_file_name).parent / file_name
 
     with open(file_path, mode) as file:
         return file.read()
@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 from functools import cache
 from typing import AsyncGenerator
 
-from aiobotocore.session import AioBaseClient, get_session
+from aiobotocore.session import AioBaseClient, AioSession, get_session
 
 REGION = "AWS_{credential_name}_REGION"
 ACCESS_KEY_ID_PATTERN = "AWS_{credential_name}_ACCESS_KEY_ID"
@@ -59,6 +59,13 @@ def _get_aws_config(credential_name: str, region_name: str | None = None) -> dic
     return aws_config
 
 
+@cache
+def _get_session() -> AioSession:
+    """Get the session used to create the clients. Creating a session loads the botocore data
+    files, so it's done only once"""
+    return get_session()
+
+
 @asynccontextmanager
 async def aws_client(
     credential_name: str, service: str, region_name: str | None = None
@@ -72,6 +79,6 @@ async def aws_client(
     taken from the environment variables for the provided credentials.
     """
     aws_config = _get_aws_config(credential_name, region_name)
-    session = get_session()
+    session = _get_session()
     async with session.create_client(service, **aws_config) as client:
         yield client
@@ -1,17 +1,29 @@
-import json
+import asyncio
 import logging
-from typing import Any, Literal, cast
+import time
+from collections import deque
+from contextlib import AsyncExitStack
+from typing import Any, Literal, NamedTuple, cast
 
 from aiobotocore.session import AioBaseClient
 from botocore.exceptions import ClientError
+from pydantic import Field
 from pydantic.dataclasses import dataclass
 
+import utils.json_tools as json_tools
 from message_queue.protocols import Message
+from message_queue.serialization import serialize_message
 
 from ...client import aws_client
 
 _logger = logging.getLogger("sqs_queue")
 
+# SQS limits for the 'SendMessageBatch' requests
+SEND_BATCH_SIZE = 10
+SEND_BATCH_MAX_BYTES = 256 * 1024
+
+QUEUE_CLOSED_ERROR = "SQS queue closed before the message was sent"
+
 
 @dataclass
 class SQSQueueConfig:
@@ -22,19 +34,40 @@ class SQSQueueConfig:
     create_queue: bool = False
     queue_wait_message_time: int = 2
     queue_visibility_time: int = 15
+    # SQS accepts receiving from 1 to 10 messages in a single request
+    receive_batch_size: int = Field(default=10, ge=1, le=10)
 
 
 class SQSMessage:
     message: dict[str, Any]
     id: str
+    received_at: float
+    _content: dict[str, Any] | None = None
 
     def __init__(self, message: dict[str, Any]) -> None:
         self.message = message
         self.id = message["ReceiptHandle"]
+        self.received_at = time.monotonic()
 
     @property
     def content(self) -> dict[str, Any]:
-        return cast(dict[str, Any], json.loads(self.message["Body"]))
+        """Message content, decoded only when it's accessed for the first time"""
+        if self._content is None:
+            self._content = cast(dict[str, Any], json_tools.loads(self.message["Body"]))
+        return self._content
+
+
+class _OutgoingMessage(NamedTuple):
+    body: str
+    size: int
+    sent: asyncio.Future[None]
+
+
+def _set_exception(messages: list[_OutgoingMessage], exception: Exception) -> None:
+    """Notify the senders of the messages that weren't sent about the error"""
+    for message in messages:
+        if not message.sent.done():
+            message.sent.set_exception(exception)
 
 
 async def _create_queue(client: AioBaseClient, queue_name: str) -> None:
@@ -47,6 +80,13 @@ async def _create_queue(client: AioBaseClient, queue_name: str) -> None:
 class Queue:
     _config: SQSQueueConfig
     _aws_client_params: dict[str, str]
+    _client: AioBaseClient | None = None
+    _client_lock: asyncio.Lock
+    _exit_stack: AsyncExitStack
+    _prefetched_messages: deque[SQSMessage]
+    _receive_lock: asyncio.Lock
+    _outbox: asyncio.Queue[_OutgoingMessage]
+    _sender_task: asyncio.Task[None] | None = None
 
     def __init__(self, config: dict[str, Any]) -> None:
         self._config = SQSQueueConfig(**config)
@@ -56,73 +96,178 @@ class Queue:
         }
         if self._config.region:
             self._aws_client_params["region_name"] = self._config.region
+        self._client_lock = asyncio.Lock()
+        self._exit_stack = AsyncExitStack()
+        self._prefetched_messages = deque()
+        self._receive_lock = asyncio.Lock()
+        self._outbox = asyncio.Queue()
 
     @property
     def queue_wait_message_time(self) -> int:
         return self._config.queue_wait_message_time
 
+    async def _get_client(self) -> AioBaseClient:
+        """Get the AWS client for the queue, creating it if it wasn't created yet. The client is
+        kept open to be reused by all the queue operations"""
+        if self._client is None:
+            # Concurrent first calls wait for the same client instead of each creating one
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = await self._exit_stack.enter_async_context(
+                        aws_client(**self._aws_client_params)
+                    )
+        return self._client
+
     async def init(self) -> None:
         """Test if the AWS SQS queue already exists and, if not, try to create if configured to"""
         _logger.info("SQS queue setup")
 
         queue_name = self._config.name
 
-        async with aws_client(**self._aws_client_params) as client:
-            try:
-                _logger.info("Checking queue")
-                await client.get_queue_url(QueueName=queue_name)
-            except ClientError as e:
-                if e.response["Error"]["Code"] != "AWS.SimpleQueueService.NonExistentQueue":
-                    raise  # pragma: no cover
-
-                if not self._config.create_queue:
-                    raise RuntimeError(
-                        "AWS SQS queue must exist or allow the application to create"
-                    )
+        client = await self._get_client()
+        try:
+            _logger.info("Checking queue")
+            await client.get_queue_url(QueueName=queue_name)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "AWS.SimpleQueueService.NonExistentQueue":
+                raise  # pragma: no cover
 
-                await _create_queue(client, queue_name)
+            if not self._config.create_queue:
+                raise RuntimeError("AWS SQS queue must exist or allow the application to create")
 
-    async def send_message(self, type: str, payload: dict[str, Any]) -> None:
-        """Send a message to the queue"""
-        async with aws_client(**self._aws_client_params) as client:
-            await client.send_message(
+            await _create_queue(client, queue_name)
+
+    async def _send_batch(self, batch: list[_OutgoingMessage]) -> None:
+        """Send a batch of messages to the queue, notifying each message sender of the result"""
+        try:
+            client = await self._get_client()
+            response = await client.send_message_batch(
                 QueueUrl=self._config.url,
-                MessageBody=json.dumps(
-                    {
-                        "type": type,
-                        "payload": payload,
-                    }
-                ),
+                Entries=[
+                    {"Id": str(index), "MessageBody": message.body}
+                    for index, message in enumerate(batch)
+                ],
             )
+        except Exception as e:
+            _set_exception(batch, e)
+            return
+
+        failed = {entry["Id"]: entry for entry in response.get("Failed", [])}
+        for index, message in enumerate(batch):
+            failure = failed.get(str(index))
+            if failure is not None:
+                _set_exception(
+                    [message], RuntimeError(f"Failed to send message: {failure.get('Message')}")
+                )
+            elif not message.sent.done():
+                message.sent.set_result(None)
+
+    async def _send_messages(self) -> None:
+        """Send the messages waiting in the outbox. Messages that are waiting at the same time are
+        grouped in batches, respecting the SQS limits for a batch"""
+        next_message: _OutgoingMessage | None = None
+        while True:
+            message = next_message or await self._outbox.get()
+            next_message = None
+            batch = [message]
+            batch_bytes = message.size
+
+            while len(batch) < SEND_BATCH_SIZE and not self._outbox.empty():
+                message = self._outbox.get_nowait()
+                if batch_bytes + message.size > SEND_BATCH_MAX_BYTES:
+                    next_message = message
+                    break
+                batch.append(message)
+                batch_bytes += message.size
+
+            try:
+                await self._send_batch(batch)
+            except asyncio.CancelledError:
+                pending_messages = batch if next_message is None else [*batch, next_message]
+                _set_exception(pending_messages, RuntimeError(QUEUE_CLOSED_ERROR))
+                raise
+
+    async def send_message(self, type: str, payload: dict[str, Any]) -> None:
+        """Send a message to the queue. Messages are sent in batches by a background task, grouping
+        the messages sent at the same time, and this method returns after the message is sent.
+        Batching only reduces the requests for concurrent senders, as a sender that waits for each
+        message will always have its messages sent alone"""
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._send_messages())
+
+        body = serialize_message(type, payload)
+        message = _OutgoingMessage(
+            body=body, size=len(body.encode()), sent=asyncio.get_running_loop().create_future()
+        )
+        self._outbox.put_nowait(message)
+        await message.sent
+
+    def _get_prefetched_message(self) -> SQSMessage | None:
+        """Get the next prefetched message that is still hidden in the queue. Messages that waited
+        too long are discarded, as they might become visible to other consumers before being
+        processed"""
+        discarded = 0
+        message: SQSMessage | None = None
+        while self._prefetched_messages:
+            message = self._prefetched_messages.popleft()
+            if time.monotonic() - message.received_at < self._config.queue_visibility_time:
+                break
+            message = None
+            discarded += 1
+
+        if discarded > 0:
+            _logger.warning(f"Discarded {discarded} expired prefetched messages")
+        return message
 
     async def get_message(self) -> Message | None:
-        """Get a message from the queue"""
-        async with aws_client(**self._aws_client_params) as client:
+        """Get a message from the queue. Messages are received in batches and the extra ones are
+        kept to be returned by the next calls, without requesting them from the queue"""
+        async with self._receive_lock:
+            prefetched_message = self._get_prefetched_message()
+            if prefetched_message is not None:
+                return prefetched_message
+
+            client = await self._get_client()
             response = await client.receive_message(
                 QueueUrl=self._config.url,
-                MaxNumberOfMessages=1,
+                MaxNumberOfMessages=self._config.receive_batch_size,
                 WaitTimeSeconds=self._config.queue_wait_message_time,
                 VisibilityTimeout=2 * self._config.queue_visibility_time,
             )
 
-            if "Messages" in response:
-                return SQSMessage(response["Messages"][0])
+            messages = [SQSMessage(message) for message in response.get("Messages", [])]
+            if len(messages) == 0:
+                return None
 
-        return None
+            self._prefetched_messages.extend(messages[1:])
+            return messages[0]
 
     async def change_visibility(self, message: Message) -> None:
         """Change the visibility time for a message in the queue"""
-        async with aws_client(**self._aws_client_params) as client:
-            await client.change_message_visibility(
-                QueueUrl=self._config.url,
-                ReceiptHandle=message.id,
-                VisibilityTimeout=2 * self._config.queue_visibility_time,
-            )
+        client = await self._get_client()
+        await client.change_message_visibility(
+            QueueUrl=self._config.url,
+            ReceiptHandle=message.id,
+            VisibilityTimeout=2 * self._config.queue_visibility_time,
+        )
 
     async def delete_message(self, message: Message) -> None:
         """Delete a message from the queue"""
-        async with aws_client(**self._aws_client_params) as client:
-            await client.delete_message(
-                QueueUrl=self._config.url,
-                ReceiptHandle=message.id,
-            )
+        client = await self._get_client()
+        await client.delete_message(
+            QueueUrl=self._config.url,
+            ReceiptHandle=message.id,
+        )
+
+    async def close(self) -> None:
+        """Stop sending the messages and close the AWS client used by the queue"""
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            await asyncio.wait([self._sender_task])
+            self._sender_task = None
+
+        while not self._outbox.empty():
+            _set_exception([self._outbox.get_nowait()], RuntimeError(QUEUE_CLOSED_ERROR))
+
+        await self._exit_stack.aclose()
+        self._client = None
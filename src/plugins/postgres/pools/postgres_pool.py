@@ -1,5 +1,6 @@
 import decimal
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import asyncpg
@@ -8,12 +9,22 @@ from configs import configs
 
 _logger = logging.getLogger("plugin.postgres.pool")
 
+DEFAULT_CONNECTION_PARAMS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "min_size": 0,
+        "max_size": 5,
+        "timeout": 10,
+        "max_inactive_connection_lifetime": 120,
+        "statement_cache_size": 100,
+        "server_settings": {"application_name": "sentinela_pool"},
+    }
+)
+
 
 def _convert_decimal_to_float(row: asyncpg.Record) -> dict[str, Any]:
     """Convert all 'Decimal' values in the data to 'float'"""
     return {
-        key: float(value) if isinstance(value, decimal.Decimal) else value
-        for key, value in dict(row).items()
+        key: float(value) if type(value) is decimal.Decimal else value for key, value in row.items()
     }
 
 
@@ -36,16 +47,7 @@ class PostgresPool:
         self.__dsn = dsn.replace("+asyncpg://", "://")
         self.name = name
 
-        self.__connection_params = {
-            "min_size": 0,
-            "max_size": 5,
-            "timeout": 10,
-            "max_inactive_connection_lifetime": 120,
-            "server_settings": {
-                "application_name": "sentinela_pool",
-            },
-        }
-        self.__connection_params.update(configs)
+        self.__connection_params = {**DEFAULT_CONNECTION_PARAMS, **configs}
 
     async def init(self) -> None:
         """Initialize the pool"""
@@ -312,11 +312,13 @@ async def send_notification(
     )
 
     if response["ok"]:
-        if notification.data is None:
-            notification.data = {}
-
-        notification.data["channel"] = response["channel"]
-        notification.data["ts"] = response["ts"]
+        # A new dict is assigned, instead of changing the current one in place, so SQLAlchemy
+        # detects the change and saves it
+        notification.data = {
+            **(notification.data or {}),
+            "channel": response["channel"],
+            "ts": response["ts"],
+        }
 
         await notification.save()
     else:
@@ -346,7 +348,7 @@ async def update_notification(
 
             # If sending a new notification message, clear the mention message so it'll be sent
             # again in the new message thread
-            notification.data["mention_ts"] = None
+            notification.data = {**notification.data, "mention_ts": None}
 
             await send_notification(
                 monitor=monitor,
@@ -369,8 +371,7 @@ async def _delete_notification(notification: Notification) -> None:
     if channel is not None and ts is not None:
         await slack.delete(channel=channel, ts=ts)
 
-    notification.data["ts"] = None
-    notification.data["channel"] = None
+    notification.data = {**notification.data, "ts": None, "channel": None}
     await notification.save()
 
 
@@ -395,7 +396,7 @@ async def _send_mention(
     )
 
     if response["ok"]:
-        notification.data["mention_ts"] = response["ts"]
+        notification.data = {**notification.data, "mention_ts": response["ts"]}
         await notification.save()
     else:
         _logger.error(
@@ -415,7 +416,7 @@ async def _delete_mention(notification: Notification) -> None:
     if channel is not None and mention_ts is not None:
         await slack.delete(channel=channel, ts=mention_ts)
 
-    notification.data["mention_ts"] = None
+    notification.data = {**notification.data, "mention_ts": None}
     await notification.save()
 
 
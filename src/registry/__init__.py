@@ -1,6 +1,7 @@
 from .registry import (
     add_monitor,
     get_monitor_module,
+    get_monitor_reaction_events,
     get_monitors,
     get_monitors_ids,
     init,
@@ -14,6 +15,7 @@ from .registry import (
 __all__ = [
     "add_monitor",
     "get_monitor_module",
+    "get_monitor_reaction_events",
     "get_monitors_ids",
     "get_monitors",
     "init",
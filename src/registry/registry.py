@@ -12,6 +12,7 @@ register them, and other modules can access.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 from typing import TYPE_CHECKING, TypedDict
 
@@ -30,6 +31,7 @@ _logger = logging.getLogger("registry")
 class MonitorInfo(TypedDict):
     name: str
     module: MonitorModule
+    reaction_events: frozenset[str]
 
 
 _monitors: dict[int, MonitorInfo] = {}
@@ -91,9 +93,32 @@ def get_monitor_module(monitor_id: int) -> MonitorModule:
     return _monitors[monitor_id]["module"]
 
 
+def get_monitor_reaction_events(monitor_id: int) -> frozenset[str]:
+    """Get the events that have reactions configured for the monitor"""
+    return _monitors[monitor_id]["reaction_events"]
+
+
+def _get_reaction_events(monitor_module: MonitorModule) -> frozenset[str]:
+    """Get the events that have at least one reaction in the monitor's 'reaction_options'"""
+    reaction_options = getattr(monitor_module, "reaction_options", None)
+    if reaction_options is None:
+        return frozenset()
+
+    return frozenset(
+        field.name
+        for field in dataclasses.fields(reaction_options)
+        if len(reaction_options[field.name]) > 0
+    )
+
+
 def add_monitor(monitor_id: int, monitor_name: str, monitor_module: MonitorModule) -> None:
-    """Add a monitor to the registry"""
-    _monitors[monitor_id] = {"name": monitor_name, "module": monitor_module}
+    """Add a monitor to the registry. The events that have reactions are calculated only once, as
+    they are checked for every event created"""
+    _monitors[monitor_id] = {
+        "name": monitor_name,
+        "module": monitor_module,
+        "reaction_events": _get_reaction_events(monitor_module),
+    }
 
 
 def init() -> None:
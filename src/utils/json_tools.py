@@ -0,0 +1,73 @@
+"""
+JSON serialization used for the queue messages and the event logs. 'orjson' is used when it's
+installed, with the 'json' module as a fallback. Both backends are configured to produce the same
+output:
+- Compact separators and non-ASCII characters written as UTF-8
+- 'int', 'float', 'bool' and 'None' keys converted to strings
+- 'datetime', 'date' and 'time' values as ISO 8601 strings, 'UUID' values as strings, enums as
+their values and dataclass instances as objects
+- Integers larger than 64 bits serialized by the 'json' module, as 'orjson' doesn't support them
+
+The differences left are:
+- 'NaN' and infinity values are written as 'null' by 'orjson' and as 'NaN' and 'Infinity' by the
+'json' module. Both are accepted by 'loads' with either backend
+- Floats might be formatted differently, like '1e16' and '1e+16', representing the same value
+"""
+
+import dataclasses
+import enum
+import json
+from datetime import date, datetime, time
+from typing import Any
+from uuid import UUID
+
+
+def _default(value: Any) -> Any:
+    """Serialize the types that 'orjson' supports natively but the 'json' module doesn't"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize the data to a JSON string using the 'json' module"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+# orjson is optional and, when installed, is used to speed up the serialization of the messages
+try:
+    import orjson
+except ImportError:
+
+    def dumps(data: Any) -> str:
+        """Serialize the data to a JSON string"""
+        return _json_dumps(data)
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize a JSON string"""
+        return json.loads(data)
+
+else:
+
+    def dumps(data: Any) -> str:
+        """Serialize the data to a JSON string"""
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # Values not supported by 'orjson', like integers larger than 64 bits, are serialized
+            # by the 'json' module, that raises a 'TypeError' if it can't serialize them either
+            return _json_dumps(data)
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize a JSON string"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Messages serialized by the 'json' module might have 'NaN' or 'Infinity' values
+            return json.loads(data)
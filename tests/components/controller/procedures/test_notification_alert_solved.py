@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -108,3 +108,38 @@ async def test_notifications_alert_solved_monitor_not_found_2_results(
 
     assert_message_in_log(caplog, "Notification with id 99999999 not found")
     assert_message_in_log(caplog, f"{notification} closed")
+
+
+async def test_notifications_alert_solved_single_session(
+    caplog, mocker, monkeypatch, sample_monitor: Monitor
+):
+    """'notifications_alert_solved' should load all the notifications at once and close them in a
+    single session"""
+    alert = await Alert.create(monitor_id=sample_monitor.id, status=AlertStatus.solved)
+    notifications = [
+        await Notification.create(
+            monitor_id=sample_monitor.id,
+            alert_id=alert.id,
+            target="",
+            status=NotificationStatus.active,
+        )
+        for _ in range(3)
+    ]
+
+    monkeypatch.setattr(
+        notifications_alert_solved.databases,
+        "query_application",
+        AsyncMock(return_value=[{"id": notification.id} for notification in notifications]),
+    )
+    get_all_spy: MagicMock = mocker.spy(Notification, "get_all")
+    get_session_spy: MagicMock = mocker.spy(notifications_alert_solved, "get_session")
+
+    await notifications_alert_solved.notifications_alert_solved()
+
+    get_all_spy.assert_called_once()
+    get_session_spy.assert_called_once()
+
+    for notification in notifications:
+        await notification.refresh()
+        assert notification.status == NotificationStatus.closed
+        assert_message_in_log(caplog, f"{notification} closed")
@@ -374,6 +374,39 @@ async def test_search_routine_skip_unique(monkeypatch, sample_monitor: Monitor):
     assert issues[0].data == {"id": 2}
 
 
+async def test_search_routine_unique_single_query(mocker, monkeypatch, sample_monitor: Monitor):
+    """'_search_routine' should check the uniqueness of all the found issues with a single
+    query"""
+    await Issue.create(
+        monitor_id=sample_monitor.id,
+        model_id="1",
+        data={"id": 1},
+        status=IssueStatus.solved,
+    )
+    await sample_monitor.load()
+
+    async def search_function():
+        return [{"id": i} for i in range(1, 6)]
+
+    monkeypatch.setattr(sample_monitor.code, "search", search_function)
+
+    issue_options = IssueOptions(model_id_key="id", unique=True)
+    monkeypatch.setattr(sample_monitor.code, "issue_options", issue_options)
+
+    get_existing_model_ids_spy: AsyncMock = mocker.spy(Issue, "get_existing_model_ids")
+
+    await monitor_handler._search_routine(sample_monitor)
+
+    get_existing_model_ids_spy.assert_awaited_once_with(
+        monitor_id=sample_monitor.id, model_ids=["1", "2", "3", "4", "5"]
+    )
+
+    issues = await Issue.get_all(
+        Issue.monitor_id == sample_monitor.id, Issue.status == IssueStatus.active
+    )
+    assert {issue.model_id for issue in issues} == {"2", "3", "4", "5"}
+
+
 async def test_search_routine_skip_solved(monkeypatch, sample_monitor: Monitor):
     """'_search_routine' should skip the items that are considered as solved by the 'is_solved'
     function"""
@@ -810,6 +843,61 @@ async def test_issues_solve_routine_solve_issues(monkeypatch, sample_monitor: Mo
     assert result == {"1": IssueStatus.solved, "2": IssueStatus.active}
 
 
+async def test_issues_solve_routine_not_solvable(mocker, monkeypatch, sample_monitor: Monitor):
+    """'_issues_solve_routine' should not check the issues if the monitor's issues are not
+    solvable"""
+    await Issue.create(
+        monitor_id=sample_monitor.id,
+        model_id="1",
+        data={"id": 1, "value": 1},
+    )
+    await sample_monitor.load()
+
+    issue_options = IssueOptions(model_id_key="id", solvable=False)
+    monkeypatch.setattr(sample_monitor.code, "issue_options", issue_options)
+    is_solved_mock = MagicMock(return_value=True)
+    monkeypatch.setattr(sample_monitor.code, "is_solved", is_solved_mock)
+    get_session_spy: MagicMock = mocker.spy(monitor_handler, "get_session")
+
+    await monitor_handler._issues_solve_routine(sample_monitor)
+
+    is_solved_mock.assert_not_called()
+    get_session_spy.assert_not_called()
+
+    issues = await Issue.get_all(Issue.monitor_id == sample_monitor.id)
+    assert [issue.status for issue in issues] == [IssueStatus.active]
+
+
+# Test _update_alert
+
+
+async def test_update_alert(mocker, sample_monitor: Monitor):
+    """'_update_alert' should load only the rule's columns of the alert's active issues, once, and
+    use them to update the alert's priority and status"""
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    await Issue.create_batch(
+        [
+            Issue(monitor_id=sample_monitor.id, model_id=str(i), data={"id": i}, alert_id=alert.id)
+            for i in range(3)
+        ]
+    )
+
+    get_raw_spy: AsyncMock = mocker.spy(Issue, "get_raw")
+    update_priority_mock = AsyncMock()
+    update_mock = AsyncMock()
+    mocker.patch.object(alert, "update_priority", update_priority_mock)
+    mocker.patch.object(alert, "update", update_mock)
+
+    await monitor_handler._update_alert(alert, CountRule(priority_levels=PriorityLevels()))
+
+    get_raw_spy.assert_called_once()
+    update_priority_mock.assert_awaited_once()
+    update_mock.assert_awaited_once_with(3)
+
+    (active_issues,) = update_priority_mock.call_args.args
+    assert [row._fields for row in active_issues] == [("id",)] * 3
+
+
 # Test _alerts_routine
 
 
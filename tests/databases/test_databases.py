@@ -43,9 +43,16 @@ async def drop_test_tables():
 
 @pytest_asyncio.fixture(loop_scope="session", scope="function")
 async def empty_pools(monkeypatch):
-    """Reset the databases pools before each test"""
+    """Reset the databases pools and the query metrics logger before each test"""
     monkeypatch.setattr(databases, "_pool_cache", {})
     monkeypatch.setattr(databases, "_pools", {})
+    monkeypatch.setattr(databases, "_metrics_queue", None)
+    monkeypatch.setattr(databases, "_metrics_task", None)
+
+    yield
+
+    if databases._metrics_task is not None:
+        databases._metrics_task.cancel()
 
 
 async def test_init(caplog, mocker, monkeypatch, empty_pools):
@@ -77,6 +84,16 @@ async def test_init(caplog, mocker, monkeypatch, empty_pools):
     assert_message_in_log(caplog, "Invalid DSN for database pool 'DATABASE_INVALID'")
 
 
+async def test_init_metrics_logger(empty_pools):
+    """'init' should create the query metrics queue and start its logger in the running loop"""
+    await databases.init()
+
+    assert isinstance(databases._metrics_queue, asyncio.Queue)
+    assert databases._metrics_task is not None
+    assert databases._metrics_task.get_loop() is asyncio.get_running_loop()
+    assert not databases._metrics_task.done()
+
+
 async def test_init_error(caplog, mocker, empty_pools):
     """'init' should log an error and continue if an exception is raised while creating a pool"""
     init_spy: MagicMock = mocker.spy(PostgresPool, "init")
@@ -106,21 +123,13 @@ async def test_fetch(caplog, monkeypatch):
         await asyncio.sleep(0.1)
         return 10
 
-    metrics = {
-        "pool_name": "name",
-        "query": "sql",
-        "args": "args",
-        "status": None,
-        "error": None,
-        "start_time": None,
-        "end_time": None,
-        "query_time": None,
-    }
+    metrics = databases.QueryMetrics(pool_name="name", query="sql", args="args")
 
     result = await databases._fetch(sleep(), metrics)
 
     assert result == 10
 
+    databases._flush_metrics(databases._metrics_queue)
     log_metrics = json.loads(caplog.records[-1].message)
 
     assert log_metrics["pool_name"] == "name"
@@ -144,16 +153,7 @@ async def test_fetch_cancelled(caplog, monkeypatch):
         await asyncio.sleep(1)
         return 20
 
-    metrics = {
-        "pool_name": "new name",
-        "query": "other sql",
-        "args": "more args",
-        "status": None,
-        "error": None,
-        "start_time": None,
-        "end_time": None,
-        "query_time": None,
-    }
+    metrics = databases.QueryMetrics(pool_name="new name", query="other sql", args="more args")
 
     sleep_task = asyncio.create_task(sleep())
     fetch_task = asyncio.create_task(databases._fetch(sleep_task, metrics))
@@ -164,6 +164,7 @@ async def test_fetch_cancelled(caplog, monkeypatch):
 
     assert result is None
 
+    databases._flush_metrics(databases._metrics_queue)
     log_metrics = json.loads(caplog.records[-1].message)
 
     assert log_metrics["pool_name"] == "new name"
@@ -186,20 +187,12 @@ async def test_fetch_error(caplog, monkeypatch):
     async def error() -> None:
         raise ValueError("some error")
 
-    metrics = {
-        "pool_name": "no name",
-        "query": "some sql",
-        "args": "many args",
-        "status": None,
-        "error": None,
-        "start_time": None,
-        "end_time": None,
-        "query_time": None,
-    }
+    metrics = databases.QueryMetrics(pool_name="no name", query="some sql", args="many args")
 
     with pytest.raises(ValueError, match="some error"):
         await databases._fetch(error(), metrics)
 
+    databases._flush_metrics(databases._metrics_queue)
     log_metrics = json.loads(caplog.records[-1].message)
 
     assert log_metrics["pool_name"] == "no name"
@@ -215,6 +208,112 @@ async def test_fetch_error(caplog, monkeypatch):
     assert log_metrics["query_time"] < 0.01
 
 
+async def test_fetch_metrics_queue_full(caplog, monkeypatch):
+    """'_fetch' should drop the metrics and log a warning if the metrics queue is full"""
+    monkeypatch.setattr(configs, "database_log_query_metrics", True)
+    monkeypatch.setattr(databases, "_metrics_queue", asyncio.Queue(maxsize=1))
+    databases._metrics_queue.put_nowait(
+        databases.QueryMetrics(pool_name="other", query="sql", args=())
+    )
+
+    async def fetch() -> int:
+        return 10
+
+    metrics = databases.QueryMetrics(pool_name="name", query="sql", args=())
+
+    result = await databases._fetch(fetch(), metrics)
+
+    assert result == 10
+    assert databases._metrics_queue.qsize() == 1
+    assert_message_in_log(caplog, "Query metrics queue is full, dropping metrics")
+
+
+async def test_fetch_metrics_not_initialized(monkeypatch):
+    """'_fetch' should not queue the metrics if the metrics queue wasn't created by 'init'"""
+    monkeypatch.setattr(configs, "database_log_query_metrics", True)
+    monkeypatch.setattr(databases, "_metrics_queue", None)
+
+    async def fetch() -> int:
+        return 10
+
+    metrics = databases.QueryMetrics(pool_name="name", query="sql", args=())
+
+    assert await databases._fetch(fetch(), metrics) == 10
+
+
+async def test_log_metrics(caplog):
+    """'_log_metrics' should log the metrics as a JSON object"""
+    databases._log_metrics(
+        databases.QueryMetrics(pool_name="pool", query="sql", args=(1, "a"), status="success")
+    )
+
+    assert json.loads(caplog.records[-1].message) == {
+        "pool_name": "pool",
+        "query": "sql",
+        "args": [1, "a"],
+        "status": "success",
+        "error": None,
+        "start_time": None,
+        "end_time": None,
+        "query_time": None,
+    }
+
+
+async def test_log_metrics_args_not_serializable(caplog):
+    """'_log_metrics' should log the query args as a string if they can't be serialized"""
+    databases._log_metrics(databases.QueryMetrics(pool_name="pool", query="sql", args=({1},)))
+
+    log_metrics = json.loads(caplog.records[-1].message)
+    assert log_metrics["pool_name"] == "pool"
+    assert log_metrics["args"] == "({1},)"
+
+
+async def test_flush_metrics(caplog):
+    """'_flush_metrics' should log the metrics waiting in the queue, respecting the provided
+    limit"""
+    metrics_queue: asyncio.Queue[databases.QueryMetrics] = asyncio.Queue()
+    for i in range(5):
+        metrics_queue.put_nowait(
+            databases.QueryMetrics(pool_name=f"pool {i}", query="sql", args=())
+        )
+
+    databases._flush_metrics(metrics_queue, 3)
+
+    assert metrics_queue.qsize() == 2
+    assert [json.loads(record.message)["pool_name"] for record in caplog.records[-3:]] == [
+        "pool 0",
+        "pool 1",
+        "pool 2",
+    ]
+
+    databases._flush_metrics(metrics_queue)
+
+    assert metrics_queue.empty()
+    assert [json.loads(record.message)["pool_name"] for record in caplog.records[-2:]] == [
+        "pool 3",
+        "pool 4",
+    ]
+
+
+async def test_metrics_logger(caplog):
+    """'_metrics_logger' should log the queued metrics in the background"""
+    metrics_queue: asyncio.Queue[databases.QueryMetrics] = asyncio.Queue()
+
+    metrics_task = asyncio.create_task(databases._metrics_logger(metrics_queue))
+
+    metrics_queue.put_nowait(databases.QueryMetrics(pool_name="pool 0", query="sql", args=()))
+    metrics_queue.put_nowait(databases.QueryMetrics(pool_name="pool 1", query="sql", args=()))
+    await asyncio.sleep(0.1)
+
+    assert metrics_queue.empty()
+    assert [json.loads(record.message)["pool_name"] for record in caplog.records[-2:]] == [
+        "pool 0",
+        "pool 1",
+    ]
+
+    metrics_task.cancel()
+
+
 async def test_query_postgresql(mocker):
     """'query' should execute a query using the specified database pool"""
     pool_fetch_spy: MagicMock = mocker.spy(PostgresPool, "fetch")
@@ -305,6 +404,28 @@ async def test_close(mocker, empty_pools):
     await databases.init()
     await databases.close()
 
+    assert databases._metrics_queue is None
+    assert databases._metrics_task is None
+
     assert len(postgresql_pools_close_spy.call_args_list) == 2
     assert ((databases._pools["application"],),) in postgresql_pools_close_spy.call_args_list
     assert ((databases._pools["local"],),) in postgresql_pools_close_spy.call_args_list
+
+
+async def test_close_flush_metrics(caplog, empty_pools):
+    """'close' should stop the metrics logger and log all the metrics still in the queue"""
+    await databases.init()
+    metrics_queue = databases._metrics_queue
+    metrics_task = databases._metrics_task
+    assert metrics_queue is not None
+    assert metrics_task is not None
+
+    metrics_queue.put_nowait(databases.QueryMetrics(pool_name="pool 0", query="sql", args=()))
+    await databases.close()
+
+    assert databases._metrics_queue is None
+    assert databases._metrics_task is None
+    assert metrics_queue.empty()
+    assert_message_in_log(caplog, '"pool_name":"pool 0"')
+    await asyncio.sleep(0)
+    assert metrics_task.cancelled()
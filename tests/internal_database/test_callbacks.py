@@ -2,7 +2,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from internal_database import get_session
+import internal_database.internal_database as internal_database
+from internal_database import get_readonly_session, get_session
 from models import Issue, IssueStatus, Monitor
 from tests.test_utils import assert_message_in_log, assert_message_not_in_log
 
@@ -43,6 +44,85 @@ async def test_callbacks(mocker, number_of_callbacks, sample_monitor: Monitor):
     assert callback_mock.await_count == number_of_callbacks
 
 
+async def test_callbacks_no_callbacks(mocker, sample_monitor: Monitor):
+    """'get_session' should not create the callbacks list if no callbacks were added to the
+    session"""
+    do_concurrently_spy: MagicMock = mocker.spy(internal_database, "do_concurrently")
+
+    async with get_session() as session:
+        session.add_callback(None)
+
+        sample_monitor.enabled = False
+        session.add(sample_monitor)
+
+    assert session._callbacks is None
+    do_concurrently_spy.assert_not_called()
+
+
+async def test_callbacks_single_callback_error(caplog, mocker, sample_monitor: Monitor):
+    """'get_session' should execute a single callback directly, logging any errors it raises"""
+
+    async def callback_error():
+        raise TypeError("callback error")
+
+    do_concurrently_spy: MagicMock = mocker.spy(internal_database, "do_concurrently")
+
+    async with get_session() as session:
+        sample_monitor.enabled = False
+        session.add(sample_monitor)
+        session.add_callback(callback_error())
+
+    do_concurrently_spy.assert_not_called()
+    assert_message_in_log(caplog, "TypeError: callback error", count=1)
+
+
+async def test_callbacks_new_instance(mocker, sample_monitor: Monitor):
+    """'get_session' should commit the session before executing the callbacks when only new
+    instances were added to it"""
+    callback_mock = AsyncMock()
+
+    async with get_session() as session:
+        commit_spy: MagicMock = mocker.spy(session, "commit")
+
+        session.add(Issue(monitor_id=sample_monitor.id, model_id="new", data={"id": "new"}))
+        session.add_callback(callback_mock())
+
+    commit_spy.assert_awaited_once()
+    callback_mock.assert_awaited_once()
+
+    issues = await Issue.get_all(Issue.monitor_id == sample_monitor.id, Issue.model_id == "new")
+    assert len(issues) == 1
+
+
+async def test_callbacks_no_changes(mocker, sample_monitor: Monitor):
+    """'get_session' should not commit the session if there're no changes in it but should still
+    execute the callbacks"""
+    callback_mock = AsyncMock()
+
+    async with get_session() as session:
+        commit_spy: MagicMock = mocker.spy(session, "commit")
+        await session.get(Monitor, ident=sample_monitor.id)
+        session.add_callback(callback_mock())
+
+    commit_spy.assert_not_called()
+    callback_mock.assert_awaited_once()
+
+
+async def test_get_readonly_session(mocker, sample_monitor: Monitor):
+    """'get_readonly_session' should return a session that can be used to read data without
+    beginning a transaction explicitly or committing it"""
+    async with get_readonly_session() as session:
+        begin_spy: MagicMock = mocker.spy(session, "begin")
+        commit_spy: MagicMock = mocker.spy(session, "commit")
+
+        monitor = await session.get(Monitor, ident=sample_monitor.id)
+        assert monitor is not None
+        assert monitor.id == sample_monitor.id
+
+    begin_spy.assert_not_called()
+    commit_spy.assert_not_called()
+
+
 async def test_callbacks_error(caplog, mocker, sample_monitor: Monitor):
     """'get_session' should not execute any of the callbacks and should cancel all callbacks
     coroutines if there's an error while the session is open"""
@@ -167,3 +247,31 @@ async def test_bulk_execute(mocker, sample_monitor: Monitor):
     assert len(solved_issues) == 2
 
     assert callback_mock.await_count == 5
+
+
+async def test_cancel_callbacks_close_error(caplog):
+    """'cancel_callbacks' should close all the callbacks even if closing some of them raises an
+    exception, clearing the callbacks list after it"""
+    callbacks = [MagicMock() for _ in range(3)]
+    callbacks[1].close.side_effect = RuntimeError("close error")
+
+    with pytest.raises(ValueError, match="session error"):
+        async with get_session() as session:
+            for callback in callbacks:
+                session.add_callback(callback)
+
+            raise ValueError("session error")
+
+    for callback in callbacks:
+        callback.close.assert_called_once()
+    assert session._callbacks == []
+    assert_message_in_log(caplog, "RuntimeError: close error")
+
+
+async def test_cancel_callbacks_no_callbacks():
+    """'cancel_callbacks' should do nothing if there're no callbacks in the session"""
+    with pytest.raises(ValueError, match="session error"):
+        async with get_session() as session:
+            raise ValueError("session error")
+
+    assert session._callbacks is None
@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import internal_database.internal_database as internal_database
+from configs import configs
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_warmup(mocker):
+    """'warmup' should open the pool connections and return them to the pool"""
+    connect_spy: MagicMock = mocker.spy(internal_database.engine, "connect")
+
+    await internal_database.warmup()
+
+    pool_size = configs.application_database_settings.pool_size
+    assert connect_spy.call_count == pool_size
+    assert internal_database.engine.pool.checkedin() == pool_size  # type: ignore[attr-defined]
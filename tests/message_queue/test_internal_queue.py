@@ -1,4 +1,7 @@
+import asyncio
+import json
 import time
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -7,6 +10,19 @@ import message_queue.internal_queue as internal_queue
 pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
+async def test_internal_message_content(mocker):
+    """'InternalMessage.content' should decode the message only when it's accessed for the first
+    time, reusing the decoded content for the next accesses"""
+    loads_spy: MagicMock = mocker.spy(internal_queue.json_tools, "loads")
+
+    message = internal_queue.InternalMessage(json.dumps({"type": "test", "payload": {"a": 1}}))
+    loads_spy.assert_not_called()
+
+    assert message.content == {"type": "test", "payload": {"a": 1}}
+    assert message.content is message.content
+    loads_spy.assert_called_once()
+
+
 @pytest.mark.parametrize("queue_wait_message_time", [1, 2, 3, 4, 5])
 async def test_queue_wait_message_time(queue_wait_message_time):
     """'queue_wait_message_time' should return the 'queue_wait_message_time'"""
@@ -36,6 +52,45 @@ async def test_send_message(message_type, message_payload):
     assert message.content == {"type": message_type, "payload": message_payload}
 
 
+async def test_get_message_wait():
+    """'get_message' should wait for a message to be sent to the queue if there're none available"""
+    queue = internal_queue.InternalQueue(config={"type": "internal", "queue_wait_message_time": 1})
+    await queue.init()
+
+    get_message_task = asyncio.create_task(queue.get_message())
+    await asyncio.sleep(0.1)
+    assert not get_message_task.done()
+
+    await queue.send_message("test", {"a": 1})
+
+    message = await get_message_task
+    assert message is not None
+    assert message.content == {"type": "test", "payload": {"a": 1}}
+
+
+async def test_get_message_multiple_consumers():
+    """'get_message' should return each message to only one of the consumers waiting for
+    messages, while the other ones keep waiting"""
+    queue = internal_queue.InternalQueue(
+        config={"type": "internal", "queue_wait_message_time": 0.2}
+    )
+    await queue.init()
+
+    get_message_tasks = [asyncio.create_task(queue.get_message()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    await queue.send_message("test", {"a": 1})
+    await queue.send_message("test", {"b": 2})
+
+    messages = await asyncio.gather(*get_message_tasks)
+    received_messages = [message.content for message in messages if message is not None]
+    assert sorted(received_messages, key=lambda content: str(content["payload"])) == [
+        {"type": "test", "payload": {"a": 1}},
+        {"type": "test", "payload": {"b": 2}},
+    ]
+    assert messages.count(None) == 1
+
+
 @pytest.mark.flaky(reruns=2)
 async def test_get_message_timeout():
     """'get_message' should wait for a message and if the timeout is reached, return 'None'"""
@@ -68,3 +123,11 @@ async def test_delete_message():
     await queue.init()
 
     await queue.delete_message(internal_queue.InternalMessage(message="{}"))
+
+
+async def test_close():
+    """'close' should do nothing"""
+    queue = internal_queue.InternalQueue(config={"type": "internal"})
+    await queue.init()
+
+    await queue.close()
@@ -1,3 +1,4 @@
+import importlib
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -22,6 +23,7 @@ def queue_mocks(monkeypatch) -> tuple[type, type]:
         get_message = AsyncMock()
         change_visibility = AsyncMock()
         delete_message = AsyncMock()
+        close = AsyncMock()
 
     class PluginQueueMock:
         class Queue:
@@ -32,6 +34,7 @@ def queue_mocks(monkeypatch) -> tuple[type, type]:
             get_message = AsyncMock()
             change_visibility = AsyncMock()
             delete_message = AsyncMock()
+            close = AsyncMock()
 
     monkeypatch.setattr(message_queue, "InternalQueue", InternalQueueMock)
     monkeypatch.setattr(
@@ -65,6 +68,40 @@ async def test_init(monkeypatch, queue_mocks, queue_type):
         raise Exception("Invalid queue type")
 
 
+@pytest.mark.parametrize("queue_type", ["internal", "plugin."])
+async def test_init_bind_queue_methods(monkeypatch, queue_mocks, queue_type):
+    """'init' should bind the queue methods directly to the module"""
+    monkeypatch.setitem(configs.application_queue, "type", queue_type)
+
+    await message_queue.init()
+
+    assert message_queue.send_message is message_queue.queue.send_message
+    assert message_queue.get_message is message_queue.queue.get_message
+    assert message_queue.change_visibility is message_queue.queue.change_visibility
+    assert message_queue.delete_message is message_queue.queue.delete_message
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("send_message", ("type", {"key": "value"})),
+        ("get_message", ()),
+        ("change_visibility", (MagicMock(),)),
+        ("delete_message", (MagicMock(),)),
+    ],
+)
+async def test_queue_methods_not_initialized(monkeypatch, method, args):
+    """The queue methods should raise a 'RuntimeError' if the queue wasn't initialized"""
+    # Keep the bound methods to restore them after the module is reloaded
+    for name in message_queue._QUEUE_METHODS:
+        monkeypatch.setattr(message_queue, name, getattr(message_queue, name))
+
+    importlib.reload(message_queue)
+
+    with pytest.raises(RuntimeError, match="Message queue not initialized"):
+        await getattr(message_queue, method)(*args)
+
+
 async def test_init_invalid_queue_type(monkeypatch):
     """'init' should raise a ValueError if the queue type is invalid"""
     monkeypatch.setitem(configs.application_queue, "type", "invalid")
@@ -210,3 +247,24 @@ async def test_delete_message(monkeypatch, queue_mocks, queue_type):
         plugin_queue_mock.delete_message.assert_awaited_once_with(message)
     else:
         raise Exception("Invalid queue type")
+
+
+@pytest.mark.parametrize("queue_type", ["internal", "plugin."])
+async def test_close(monkeypatch, queue_mocks, queue_type):
+    """'close' should close the queue calling the right module"""
+    monkeypatch.setitem(configs.application_queue, "type", queue_type)
+
+    internal_queue_mock, plugin_queue = queue_mocks
+    plugin_queue_mock = plugin_queue.Queue
+
+    await message_queue.init()
+    await message_queue.close()
+
+    if queue_type == "internal":
+        internal_queue_mock.close.assert_awaited_once()
+        plugin_queue_mock.close.assert_not_called()
+    elif queue_type == "plugin.":
+        internal_queue_mock.close.assert_not_called()
+        plugin_queue_mock.close.assert_awaited_once()
+    else:
+        raise Exception("Invalid queue type")
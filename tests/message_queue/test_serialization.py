@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+import message_queue.serialization as serialization
+
+
+@pytest.mark.parametrize(
+    "message_type, payload",
+    [
+        ("event", {"a": 1, "b": [1, 2, 3], "c": None}),
+        ("request", {"action": "alert_lock", "params": {"target_id": 1}}),
+        ("process_monitor", {}),
+        ('type "with" quotes', {"d": "e"}),
+    ],
+)
+def test_serialize_message(message_type, payload):
+    """'serialize_message' should serialize the message type and payload to a JSON string"""
+    result = serialization.serialize_message(message_type, payload)
+    assert json.loads(result) == {"type": message_type, "payload": payload}
+
+
+def test_serialize_message_prefix_cache():
+    """'serialize_message' should build the message prefix only once for each message type"""
+    serialization._message_prefix.cache_clear()
+
+    serialization.serialize_message("event", {"a": 1})
+    serialization.serialize_message("event", {"b": 2})
+    serialization.serialize_message("request", {"c": 3})
+
+    cache_info = serialization._message_prefix.cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 1
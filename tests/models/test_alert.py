@@ -6,7 +6,16 @@ import pytest
 
 import models.utils.priority as priority_utils
 import utils.time as time_utils
-from data_models.monitor_options import AgeRule, AlertOptions, IssueOptions, PriorityLevels
+from configs import configs
+from data_models.monitor_options import (
+    AgeRule,
+    AlertOptions,
+    CountRule,
+    IssueOptions,
+    PriorityLevels,
+    ValueRule,
+)
+from internal_database import CallbackSession
 from models import Alert, AlertPriority, AlertStatus, Issue, IssueStatus, Monitor
 from registry import registry
 from tests.test_utils import assert_message_in_log, assert_message_not_in_log
@@ -171,6 +180,55 @@ async def test_can_solve(monkeypatch, sample_monitor: Monitor, solvable):
     assert alert.can_solve is not solvable
 
 
+@pytest.mark.parametrize(
+    "rule, expected_fields",
+    [
+        (AgeRule(priority_levels=PriorityLevels()), ("created_at",)),
+        (CountRule(priority_levels=PriorityLevels()), ("id",)),
+        (
+            ValueRule(
+                value_key="value", operation="greater_than", priority_levels=PriorityLevels()
+            ),
+            ("data",),
+        ),
+    ],
+)
+async def test_get_active_issues_rows(sample_monitor: Monitor, rule, expected_fields):
+    """'Alert.get_active_issues_rows' should return the alert's active issues with only the
+    columns used by the priority rule"""
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    other_alert = await Alert.create(monitor_id=sample_monitor.id)
+
+    issues = await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(i),
+                data={"value": i},
+                alert_id=alert_id,
+                status=status,
+            )
+            for i, (alert_id, status) in enumerate(
+                [
+                    (alert.id, IssueStatus.active),
+                    (alert.id, IssueStatus.active),
+                    (alert.id, IssueStatus.solved),
+                    (other_alert.id, IssueStatus.active),
+                ]
+            )
+        ]
+    )
+
+    rows = await alert.get_active_issues_rows(rule)
+
+    assert all(row._fields == expected_fields for row in rows)
+    expected_rows = [
+        tuple(getattr(issue, field) for field in expected_fields) for issue in issues[:2]
+    ]
+    assert len(rows) == len(expected_rows)
+    assert all(tuple(row) in expected_rows for row in rows)
+
+
 async def test_calculate_priority(mocker, sample_monitor: Monitor):
     """'Alert.calculate_priority' should use the 'calculate_priority' function to calculate an
     alert priority"""
@@ -233,6 +291,81 @@ async def test_update_priority_none(monkeypatch, sample_monitor: Monitor):
     assert loaded_alert.priority == priority_utils.AlertPriority.low
 
 
+async def test_update_priority_active_issues(monkeypatch, sample_monitor: Monitor):
+    """'Alert.update_priority' should calculate the priority using only the alert's active
+    issues"""
+    alert = await Alert.create(monitor_id=sample_monitor.id, priority=AlertPriority.low)
+    monitor_code = registry._monitors[sample_monitor.id]["module"]
+    alert_options = AlertOptions(
+        rule=ValueRule(
+            value_key="value",
+            operation="greater_than",
+            priority_levels=PriorityLevels(low=0, moderate=10, high=20, critical=30),
+        )
+    )
+    monkeypatch.setattr(monitor_code, "alert_options", alert_options, raising=False)
+
+    await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(value),
+                data={"value": value},
+                alert_id=alert.id,
+                status=status,
+            )
+            for value, status in [
+                (15, IssueStatus.active),
+                (5, IssueStatus.active),
+                (35, IssueStatus.solved),
+            ]
+        ]
+    )
+
+    await alert.update_priority()
+
+    loaded_alert = await Alert.get_by_id(alert.id)
+    assert loaded_alert is not None
+    assert loaded_alert.priority == AlertPriority.moderate
+
+
+async def test_update_priority_provided_active_issues(mocker, monkeypatch, sample_monitor: Monitor):
+    """'Alert.update_priority' should calculate the priority using the provided active issues,
+    without loading them again"""
+    alert = await Alert.create(monitor_id=sample_monitor.id, priority=AlertPriority.low)
+    monitor_code = registry._monitors[sample_monitor.id]["module"]
+    alert_options = AlertOptions(
+        rule=ValueRule(
+            value_key="value",
+            operation="greater_than",
+            priority_levels=PriorityLevels(low=0, moderate=10, high=20, critical=30),
+        )
+    )
+    monkeypatch.setattr(monitor_code, "alert_options", alert_options, raising=False)
+
+    active_issues = await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(value),
+                data={"value": value},
+                alert_id=alert.id,
+            )
+            for value in [25, 5]
+        ]
+    )
+
+    issue_get_raw_spy: AsyncMock = mocker.spy(Issue, "get_raw")
+
+    await alert.update_priority(active_issues)
+
+    issue_get_raw_spy.assert_not_called()
+
+    loaded_alert = await Alert.get_by_id(alert.id)
+    assert loaded_alert is not None
+    assert loaded_alert.priority == AlertPriority.high
+
+
 @pytest.mark.parametrize(
     "current_priority, new_priority",
     [
@@ -458,6 +591,37 @@ async def test_link_issues_linked(caplog, mocker, sample_monitor: Monitor):
     assert_message_in_log(caplog, "Issues linked")
 
 
+async def test_link_issues_single_transaction(mocker, monkeypatch, sample_monitor: Monitor):
+    """'Alert.link_issues' should link all the issues in a single transaction, queueing the
+    'issue_linked' event for each one of them after the commit"""
+    # Saving the events would commit other sessions
+    monkeypatch.setattr(configs, "save_events_mode", "off")
+
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    issues = await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(i),
+                data={"id": i},
+            )
+            for i in range(5)
+        ]
+    )
+
+    commit_spy: AsyncMock = mocker.spy(CallbackSession, "commit")
+    callbacks_spies = [mocker.spy(issue, "_link_to_alert_callback") for issue in issues]
+
+    await alert.link_issues(issues)
+
+    commit_spy.assert_awaited_once()
+    for callback_spy in callbacks_spies:
+        callback_spy.assert_called_once()
+
+    linked_issues = await Issue.get_all(Issue.alert_id == alert.id)
+    assert len(linked_issues) == 5
+
+
 async def test_link_issues_dismiss_acknowledge(
     caplog, mocker, monkeypatch, sample_monitor: Monitor
 ):
@@ -940,6 +1104,40 @@ async def test_update_not_solved(caplog, mocker, sample_monitor: Monitor):
     assert_message_in_log(caplog, "Updated")
 
 
+@pytest.mark.parametrize("issues_count", [0, 1, 3])
+async def test_update_provided_active_issues_count(mocker, sample_monitor: Monitor, issues_count):
+    """'Alert.update' should use the provided active issues count to check if the alert is solved,
+    without counting them again"""
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(i),
+                data={"id": i},
+                alert_id=alert.id,
+            )
+            for i in range(issues_count)
+        ]
+    )
+
+    issue_count_spy: AsyncMock = mocker.spy(Issue, "count")
+    alert_solve_spy: MagicMock = mocker.spy(alert, "solve")
+
+    await alert.update(issues_count)
+
+    issue_count_spy.assert_not_called()
+
+    loaded_alert = await Alert.get_by_id(alert.id)
+    assert loaded_alert is not None
+    if issues_count == 0:
+        alert_solve_spy.assert_called_once()
+        assert loaded_alert.status == AlertStatus.solved
+    else:
+        alert_solve_spy.assert_not_called()
+        assert loaded_alert.status == AlertStatus.active
+
+
 @pytest.mark.parametrize("alert_status", [AlertStatus.solved])
 async def test_solve_issues_not_active(caplog, mocker, sample_monitor: Monitor, alert_status):
     """'Alert.solve_issues' should not solve the alert's issues if it's not active"""
@@ -1045,6 +1243,45 @@ async def test_solve_issues_not_solvable(caplog, mocker, monkeypatch, sample_mon
     alert_update_spy.assert_called_once()
 
 
+async def test_solve_issues_single_transaction(mocker, monkeypatch, sample_monitor: Monitor):
+    """'Alert.solve_issues' should solve all the issues in a single transaction, queueing the
+    'issue_solved' event for each one of them after the commit"""
+    # Saving the events would commit other sessions
+    monkeypatch.setattr(configs, "save_events_mode", "off")
+
+    monitor_code = registry._monitors[sample_monitor.id]["module"]
+    issue_options = IssueOptions(model_id_key="id", solvable=False)
+    monkeypatch.setattr(monitor_code, "issue_options", issue_options)
+
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(i),
+                data={"id": i},
+                alert_id=alert.id,
+            )
+            for i in range(5)
+        ]
+    )
+
+    monkeypatch.setattr(alert, "acknowledge", AsyncMock())
+    monkeypatch.setattr(alert, "update", AsyncMock())
+    commit_spy: AsyncMock = mocker.spy(CallbackSession, "commit")
+    solve_callback_spy: MagicMock = mocker.spy(Issue, "_solve_callback")
+
+    await alert.solve_issues()
+
+    commit_spy.assert_awaited_once()
+    assert solve_callback_spy.call_count == 5
+
+    solved_issues = await Issue.get_all(
+        Issue.alert_id == alert.id, Issue.status == IssueStatus.solved
+    )
+    assert len(solved_issues) == 5
+
+
 @pytest.mark.parametrize("alert_status", [AlertStatus.solved])
 async def test_solve_not_active(caplog, mocker, sample_monitor: Monitor, alert_status):
     """'Alert.solve' should set itself as solved if it's not active"""
@@ -1,13 +1,15 @@
 import asyncio
 import logging
 import math
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 
 import message_queue as message_queue
+import utils.json_tools as json_tools
 import utils.time as time_utils
 from configs import configs
 from data_models.event_payload import EventPayload
@@ -15,6 +17,7 @@ from data_models.monitor_options import ReactionOptions
 from databases.databases import execute_application
 from internal_database import get_session
 from models import Alert, Event, Issue, IssueStatus, Monitor
+from models.base import format_value
 from registry import registry
 from tests.test_utils import assert_message_in_log
 
@@ -24,10 +27,46 @@ pytestmark = pytest.mark.asyncio(loop_scope="session")
 async def do_nothing(): ...
 
 
+@pytest.mark.parametrize(
+    "value, expected_result",
+    [
+        (1, 1),
+        (1.5, 1.5),
+        ("value", "value"),
+        (True, True),
+        (None, None),
+        ({"id": 1}, {"id": 1}),
+        ([1, 2], [1, 2]),
+        (datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "2024-01-02T03:04:05+00:00"),
+        (IssueStatus.active, "active"),
+    ],
+)
+async def test_format_value(value, expected_result):
+    """'format_value' should format datetimes and enums values and return the other values
+    unchanged"""
+    assert format_value(value) == expected_result
+
+
 # To test the Base class other models will be used, because most of the methods will make
 # operations on the internal database, so there must be a table for it
 
 
+@pytest.mark.parametrize(
+    "model, class_name_lower, has_post_create",
+    [
+        (Alert, "alert", False),
+        (Issue, "issue", False),
+        (Monitor, "monitor", True),
+    ],
+)
+async def test_init_subclass(model, class_name_lower, has_post_create):
+    """'Base.__init_subclass__' should build the class name strings used by the events and check
+    if the '_post_create' method is implemented for each model"""
+    assert model._class_name_lower == class_name_lower
+    assert model._created_event_name == f"{class_name_lower}_created"
+    assert model._has_post_create is has_post_create
+
+
 async def test_lock(monkeypatch, sample_monitor: Monitor):
     """'Base.lock' should prevent concurrent tasks changing the same instance at the same time"""
 
@@ -83,6 +122,7 @@ async def test_should_queue_event_invalid_event(monkeypatch, sample_monitor: Mon
         ReactionOptions(alert_created=[do_nothing]),
         raising=False,
     )
+    registry.add_monitor(sample_monitor.id, sample_monitor.name, monitor_code)
 
     assert sample_monitor._should_queue_event(event_name) is False
 
@@ -106,6 +146,7 @@ async def test_should_queue_event(monkeypatch, sample_monitor: Monitor, event_na
         ReactionOptions(**{event_name: [do_nothing]}),
         raising=False,
     )
+    registry.add_monitor(sample_monitor.id, sample_monitor.name, monitor_code)
 
     assert sample_monitor._should_queue_event(event_name) is True
     assert sample_monitor._should_queue_event("alert_acknowledged") is False
@@ -143,7 +184,7 @@ async def test_build_event_payload(sample_monitor: Monitor):
 
 
 @pytest.mark.parametrize(
-    "save_events_mode, monitor_save_events, expected_event_created",
+    "save_events_mode, monitor_save_events, expected_result",
     [
         ("all", False, True),
         ("all", True, True),
@@ -153,19 +194,25 @@ async def test_build_event_payload(sample_monitor: Monitor):
         ("off", True, False),
     ],
 )
-async def test_save_event(
+async def test_should_save_event(
     monkeypatch,
     sample_monitor: Monitor,
     save_events_mode,
     monitor_save_events,
-    expected_event_created,
+    expected_result,
 ):
-    """'Base._save_event' should create an event only when the save config allows it"""
+    """'Base._should_save_event' should return if the event should be saved, based on the save
+    config"""
     monkeypatch.setattr(configs, "save_events_mode", save_events_mode)
 
     monitor_module = registry._monitors[sample_monitor.id]["module"]
     monkeypatch.setattr(monitor_module.monitor_options, "save_events", monitor_save_events)
 
+    assert sample_monitor._should_save_event() is expected_result
+
+
+async def test_save_event(sample_monitor: Monitor):
+    """'Base._save_event' should create an event with the provided payload"""
     event_payload = {
         "event_name": "issue_created",
         "event_source_monitor_id": sample_monitor.id,
@@ -181,17 +228,14 @@ async def test_save_event(
     async with get_session() as session:
         events = (await session.execute(statement)).scalars().all()
 
-    if expected_event_created:
-        assert len(events) == 1
-        event = events[0]
-        assert event.name == event_payload["event_name"]
-        assert event.monitor_id == event_payload["event_source_monitor_id"]
-        assert event.source == event_payload["event_source"]
-        assert event.source_id == event_payload["event_source_id"]
-        assert event.data == event_payload["event_data"]
-        assert event.extra_payload == event_payload["extra_payload"]
-    else:
-        assert len(events) == 0
+    assert len(events) == 1
+    event = events[0]
+    assert event.name == event_payload["event_name"]
+    assert event.monitor_id == event_payload["event_source_monitor_id"]
+    assert event.source == event_payload["event_source"]
+    assert event.source_id == event_payload["event_source_id"]
+    assert event.data == event_payload["event_data"]
+    assert event.extra_payload == event_payload["extra_payload"]
 
 
 @pytest.mark.parametrize(
@@ -216,6 +260,7 @@ async def test_create_event_queued(
         ReactionOptions(**{event_name: [do_nothing]}),
         raising=False,
     )
+    registry.add_monitor(sample_monitor.id, sample_monitor.name, monitor_code)
 
     build_event_payload_spy: MagicMock = mocker.spy(sample_monitor, "_build_event_payload")
     build_event_payload_spy.return_value = {"some_event": "some_data"}
@@ -325,6 +370,40 @@ async def test_create_event_not_queued_logged(
     assert event.extra_payload == extra_payload
 
 
+async def test_create_event_skipped(mocker, monkeypatch, sample_monitor: Monitor):
+    """'Base._create_event' should not build the event payload when the event won't be queued,
+    logged or saved"""
+    monkeypatch.setattr(configs, "log_all_events", False)
+    monkeypatch.setattr(configs, "save_events_mode", "off")
+
+    build_event_payload_spy: MagicMock = mocker.spy(sample_monitor, "_build_event_payload")
+    queue_send_message_spy: MagicMock = mocker.spy(message_queue, "send_message")
+    save_event_spy: MagicMock = mocker.spy(sample_monitor, "_save_event")
+
+    await sample_monitor._create_event("alert_created")
+
+    build_event_payload_spy.assert_not_called()
+    queue_send_message_spy.assert_not_called()
+    save_event_spy.assert_not_called()
+
+
+async def test_create_event_log_level_disabled(
+    caplog, mocker, monkeypatch, sample_monitor: Monitor
+):
+    """'Base._create_event' should not serialize the event payload to log it when the logger's
+    'INFO' level is disabled"""
+    monkeypatch.setattr(configs, "log_all_events", True)
+    monkeypatch.setattr(configs, "save_events_mode", "off")
+    monkeypatch.setattr(sample_monitor._logger, "isEnabledFor", lambda level: False)
+
+    json_dumps_spy: MagicMock = mocker.spy(json_tools, "dumps")
+
+    await sample_monitor._create_event("alert_created")
+
+    json_dumps_spy.assert_not_called()
+    assert '"event_name": "alert_created"' not in caplog.text
+
+
 async def test_logger(sample_monitor: Monitor):
     """'Base._logger' should lazy load a 'Logger' object"""
     with pytest.raises(AttributeError):
@@ -376,8 +455,9 @@ async def test_count(sample_monitor: Monitor, size):
 
 @pytest.mark.parametrize("size", range(5))
 async def test_create_batch(mocker, sample_monitor: Monitor, size):
-    """'Base.create_batch' should create a list of instances in the database, call their
-    '_post_create' methods and queue the creation events for them"""
+    """'Base.create_batch' should create a list of instances in the database and queue the
+    creation events for them. The '_post_create' method should not be called if the model doesn't
+    implement it"""
     issues_to_create = [
         Issue(
             monitor_id=sample_monitor.id,
@@ -398,11 +478,29 @@ async def test_create_batch(mocker, sample_monitor: Monitor, size):
     for issue in await Issue.get_all(Issue.monitor_id == sample_monitor.id):
         assert issue.id is not None
     for post_create_spy in post_create_spies:
-        post_create_spy.assert_called_once()
+        post_create_spy.assert_not_called()
     for create_event_spy in create_event_spies:
         create_event_spy.assert_called_once_with("issue_created")
 
 
+@pytest.mark.parametrize("size", range(1, 4))
+async def test_create_batch_post_create(mocker, size):
+    """'Base.create_batch' should call the instances' '_post_create' methods if the model
+    implements it"""
+    monitors_to_create = [
+        Monitor(name=f"test_create_batch_post_create_{time.time_ns()}_{i}") for i in range(size)
+    ]
+
+    post_create_spies = [mocker.spy(monitor, "_post_create") for monitor in monitors_to_create]
+
+    await Monitor.create_batch(monitors_to_create)
+
+    for monitor in monitors_to_create:
+        assert monitor.id is not None
+    for post_create_spy in post_create_spies:
+        post_create_spy.assert_called_once()
+
+
 async def test_create(mocker, sample_monitor: Monitor):
     """'Base.create' should create an instance in the database, call it's '_post_create' method and
     queue the creation event for it"""
@@ -582,6 +680,34 @@ async def test_get_all_limit(sample_monitor: Monitor):
     assert sorted_issues_ids == list(reversed(issues_ids[-2:]))
 
 
+async def test_get_all_from_statement(sample_monitor: Monitor):
+    """'Base.get_all_from_statement' should return all instances selected by the provided lambda
+    statement, using the parameters of each execution"""
+    issues = await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=str(i),
+                data={"id": i},
+                status=IssueStatus.active,
+            )
+            for i in range(3)
+        ]
+    )
+
+    monitor_id = sample_monitor.id
+    for issue in issues:
+        model_id = issue.model_id
+        result = await Issue.get_all_from_statement(
+            lambda_stmt(
+                lambda: select(Issue).where(
+                    Issue.monitor_id == monitor_id, Issue.model_id == model_id
+                )
+            )
+        )
+        assert [result_issue.id for result_issue in result] == [issue.id]
+
+
 async def test_get_or_create(sample_monitor: Monitor):
     """'Base.get_or_create' should try to get an instance that matches the the provided filters and
     if none was found, try to create it"""
@@ -112,3 +112,22 @@ async def test_register(sample_monitor: Monitor):
     assert code_module.code == "def get_value(): return 20"
     assert code_module.additional_files == {"file1.py": "content1", "file2.py": "content2"}
     assert code_module.registered_at > now() - timedelta(seconds=1)
+
+
+async def test_register_same_additional_files_object(sample_monitor: Monitor):
+    """'CodeModule.register' should save the additional files even if they are the current
+    additional files object changed in place"""
+    code_module = await CodeModule.get(CodeModule.monitor_id == sample_monitor.id)
+
+    assert code_module is not None
+
+    await code_module.register(code="def get_value(): return 20", additional_files={"a.py": "a"})
+
+    additional_files = code_module.additional_files
+    additional_files["b.py"] = "b"
+    await code_module.register(code="def get_value(): return 20", additional_files=additional_files)
+
+    loaded_code_module = await CodeModule.get_by_id(code_module.id)
+
+    assert loaded_code_module is not None
+    assert loaded_code_module.additional_files == {"a.py": "a", "b.py": "b"}
@@ -12,21 +12,42 @@ pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 @pytest.mark.parametrize("issue_status", IssueStatus)
-async def test_is_unique_active(sample_monitor: Monitor, issue_status):
-    """'Issue.is_unique' should return if the provided 'model_id' is unique for the monitor, for
-    any possible issue status"""
-    is_unique = await Issue.is_unique(sample_monitor.id, "12345")
-    assert is_unique
-
-    await Issue.create(
-        monitor_id=sample_monitor.id,
-        model_id="12345",
-        data={"id": 1},
-        status=issue_status,
+async def test_get_existing_model_ids(sample_monitor: Monitor, issue_status):
+    """'Issue.get_existing_model_ids' should return the provided model ids that already have
+    issues for the monitor, for any possible issue status"""
+    await Issue.create_batch(
+        [
+            Issue(
+                monitor_id=sample_monitor.id,
+                model_id=model_id,
+                data={"id": model_id},
+                status=issue_status,
+            )
+            for model_id in ["1", "2", "3"]
+        ]
     )
 
-    is_unique = await Issue.is_unique(sample_monitor.id, "12345")
-    assert not is_unique
+    existing_model_ids = await Issue.get_existing_model_ids(sample_monitor.id, ["2", "3", "4", "5"])
+    assert existing_model_ids == {"2", "3"}
+
+
+async def test_get_existing_model_ids_other_monitor(sample_monitor: Monitor):
+    """'Issue.get_existing_model_ids' should not return model ids of other monitors' issues"""
+    await Issue.create(monitor_id=sample_monitor.id, model_id="1", data={"id": 1})
+
+    existing_model_ids = await Issue.get_existing_model_ids(sample_monitor.id + 1, ["1"])
+    assert existing_model_ids == set()
+
+
+async def test_get_existing_model_ids_empty_list(mocker, sample_monitor: Monitor):
+    """'Issue.get_existing_model_ids' should return an empty set without querying the database
+    when no model ids are provided"""
+    get_raw_spy: MagicMock = mocker.spy(Issue, "get_raw")
+
+    existing_model_ids = await Issue.get_existing_model_ids(sample_monitor.id, [])
+
+    assert existing_model_ids == set()
+    get_raw_spy.assert_not_called()
 
 
 async def test_options(sample_monitor: Monitor):
@@ -407,6 +428,28 @@ async def test_update_data_active(mocker, monkeypatch, sample_monitor: Monitor):
     callback_spy.assert_called_once_with()
 
 
+async def test_update_data_same_object(monkeypatch, sample_monitor: Monitor):
+    """'Issue.update_data' should update the issue data even if the new data is the current data
+    object changed in place"""
+    issue = await Issue.create(
+        monitor_id=sample_monitor.id,
+        model_id="12345",
+        data={"id": 1},
+    )
+
+    monitor_code = registry._monitors[sample_monitor.id]["module"]
+    monkeypatch.setattr(monitor_code, "is_solved", lambda issue_data: False)
+
+    new_data = issue.data
+    new_data["value"] = 10
+    await issue.update_data(new_data)
+
+    issues = await Issue.get_all(Issue.monitor_id == sample_monitor.id)
+
+    assert len(issues) == 1
+    assert issues[0].data == {"id": 1, "value": 10}
+
+
 @pytest.mark.parametrize("issue_status", [IssueStatus.dropped, IssueStatus.solved])
 async def test_update_data_not_active(caplog, mocker, sample_monitor: Monitor, issue_status):
     """'Issue.update_data' should not update the issue data if if the issue is not active and the
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import json
 from datetime import datetime, timedelta, timezone
@@ -11,6 +12,7 @@ import message_queue
 import utils.time as time_utils
 from data_models.monitor_options import AlertOptions, CountRule, PriorityLevels, ReactionOptions
 from exceptions.controller import MonitorQueueException
+from internal_database import get_session
 from models import Alert, AlertStatus, Issue, IssueStatus, Monitor
 from registry import registry
 from tests.message_queue.utils import get_queue_items
@@ -220,6 +222,49 @@ async def test_code(sample_monitor: Monitor):
     assert sample_monitor.code == monitor_code
 
 
+async def test_code_cached(monkeypatch, sample_monitor: Monitor):
+    """'Monitor.code' should get the monitor's code from the registry only once for each instance"""
+    monitor_code = sample_monitor.code
+
+    other_module = ModuleType(name="other_module")
+    monkeypatch.setitem(registry._monitors[sample_monitor.id], "module", other_module)
+
+    assert sample_monitor.code is monitor_code
+
+    monitor = await Monitor.get_by_id(sample_monitor.id)
+    assert monitor is not None
+    assert monitor.code is other_module
+
+
+@pytest.mark.parametrize("attribute_names", [None, ["enabled"]])
+async def test_code_cache_cleared_on_refresh(monkeypatch, sample_monitor: Monitor, attribute_names):
+    """'Monitor.code' should get the monitor's code from the registry again after the monitor is
+    refreshed, as it might've been registered again"""
+    assert sample_monitor.code is registry._monitors[sample_monitor.id]["module"]
+
+    other_module = ModuleType(name="other_module")
+    monkeypatch.setitem(registry._monitors[sample_monitor.id], "module", other_module)
+
+    await sample_monitor.refresh(attribute_names)
+
+    assert sample_monitor.code is other_module
+
+
+async def test_code_cache_cleared_on_expire(monkeypatch, sample_monitor: Monitor):
+    """'Monitor.code' should get the monitor's code from the registry again after the monitor is
+    expired"""
+    assert sample_monitor.code is registry._monitors[sample_monitor.id]["module"]
+
+    other_module = ModuleType(name="other_module")
+    monkeypatch.setitem(registry._monitors[sample_monitor.id], "module", other_module)
+
+    async with get_session() as session:
+        session.add(sample_monitor)
+        session.expire(sample_monitor, ["enabled"])
+
+    assert sample_monitor.code is other_module
+
+
 async def test_options(sample_monitor: Monitor):
     """'Monitor.options' should return the monitor's 'monitor_options' from it's code module"""
     monitor_code = registry._monitors[sample_monitor.id]["module"]
@@ -371,6 +416,43 @@ async def test_load(mocker, sample_monitor: Monitor):
     load_active_alerts_spy.assert_called_once()
 
 
+async def test_load_error(mocker, sample_monitor: Monitor):
+    """'Monitor.load' should raise any errors that happen while loading the active issues or
+    alerts, cancelling the other load"""
+    load_active_issues_cancelled = False
+
+    async def load_active_issues():
+        nonlocal load_active_issues_cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            load_active_issues_cancelled = True
+            raise
+
+    mocker.patch.object(sample_monitor, "load_active_issues", side_effect=load_active_issues)
+    mocker.patch.object(
+        sample_monitor, "load_active_alerts", side_effect=ValueError("Something went wrong")
+    )
+
+    with pytest.raises(ValueError, match="Something went wrong"):
+        await sample_monitor.load()
+
+    assert load_active_issues_cancelled
+
+
+async def test_load_error_both(mocker, sample_monitor: Monitor):
+    """'Monitor.load' should raise the first error if both the active issues and alerts fail to
+    load, keeping the errors group as its context"""
+    mocker.patch.object(sample_monitor, "load_active_issues", side_effect=ValueError("issues"))
+    mocker.patch.object(sample_monitor, "load_active_alerts", side_effect=ValueError("alerts"))
+
+    with pytest.raises(ValueError) as error:
+        await sample_monitor.load()
+
+    assert isinstance(error.value.__context__, ExceptionGroup)
+    assert [str(e) for e in error.value.__context__.exceptions] == ["issues", "alerts"]
+
+
 async def test_process_monitor_first_run(clear_queue, sample_monitor: Monitor):
     """'Monitor.process' should queue both 'search' and 'update' tasks if it's the first time it's
     being processed"""
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 
 import utils.time as time_utils
+from internal_database import get_session
 from models import Alert, Monitor, Notification, NotificationStatus
 from tests.test_utils import assert_message_in_log
 
@@ -35,3 +36,26 @@ async def test_close(caplog, mocker, sample_monitor: Monitor):
     assert notification.closed_at > time_utils.now() - timedelta(seconds=1)
     notification_create_event_spy.assert_called_once_with("notification_closed")
     assert_message_in_log(caplog, "Closed")
+
+
+async def test_close_session(mocker, sample_monitor: Monitor):
+    """'Notification.close' should use the provided session and only queue the event after the
+    session is committed"""
+    alert = await Alert.create(monitor_id=sample_monitor.id)
+    notification = await Notification.create(
+        monitor_id=sample_monitor.id,
+        alert_id=alert.id,
+        target="aaa",
+    )
+
+    notification_create_event_spy: MagicMock = mocker.spy(notification, "_create_event")
+
+    async with get_session() as session:
+        await notification.close(session=session)
+        notification_create_event_spy.assert_not_called()
+
+    notification_create_event_spy.assert_called_once_with("notification_closed")
+
+    loaded_notification = await Notification.get_by_id(notification.id)
+    assert loaded_notification is not None
+    assert loaded_notification.status == NotificationStatus.closed
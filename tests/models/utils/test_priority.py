@@ -12,6 +12,16 @@ from models.utils.priority import AlertPriority
 pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
+async def test_priority_levels_sorted_levels():
+    """'PriorityLevels.sorted_levels' should return only the defined levels, from the highest
+    priority to the lowest, and calculate them only once"""
+    priority_levels = PriorityLevels(informational=1, moderate=3, critical=5)
+
+    sorted_levels = priority_levels.sorted_levels
+    assert sorted_levels == (("critical", 5), ("moderate", 3), ("informational", 1))
+    assert priority_levels.sorted_levels is sorted_levels
+
+
 @pytest.mark.parametrize(
     "seconds_ago, expected_priority",
     [
@@ -75,6 +85,13 @@ async def test_calculate_age_rule_missing_priorities(sample_monitor: Monitor, pr
     assert result_priority == provided_level
 
 
+async def test_calculate_age_rule_no_issues():
+    """'_calculate_age_rule' should return 'None' if there're no issues"""
+    rule = AgeRule(priority_levels=PriorityLevels(critical=0))
+
+    assert priority._calculate_age_rule(rule, []) is None
+
+
 @pytest.mark.parametrize(
     "number_of_issues, expected_priority",
     [
@@ -269,6 +286,109 @@ async def test_calculate_value_rule_lesser_than_missing_priorities(
     assert result_priority == provided_level
 
 
+@pytest.mark.parametrize("operation", ["greater_than", "lesser_than"])
+async def test_calculate_value_rule_no_issues(operation):
+    """'_calculate_value_rule' should return 'None' if there're no issues"""
+    rule = ValueRule(
+        value_key="value", operation=operation, priority_levels=PriorityLevels(critical=0)
+    )
+
+    assert priority._calculate_value_rule(rule, []) is None
+
+
+@pytest.mark.parametrize("operation", ["greater_than", "lesser_than"])
+@pytest.mark.parametrize("number_of_issues", [1, 3])
+async def test_calculate_value_rule_missing_value(
+    sample_monitor: Monitor, operation, number_of_issues
+):
+    """'_calculate_value_rule' should return 'None' if none of the issues have the 'value_key' in
+    their data"""
+    issues = [
+        await Issue.create(monitor_id=sample_monitor.id, model_id=f"{i}", data={"id": i})
+        for i in range(number_of_issues)
+    ]
+
+    rule = ValueRule(
+        value_key="value",
+        operation=operation,
+        priority_levels=PriorityLevels(critical=-100, informational=100),
+    )
+
+    assert priority._calculate_value_rule(rule, issues) is None
+
+
+@pytest.mark.parametrize(
+    "operation, expected_priority",
+    [
+        ("greater_than", AlertPriority.high),
+        ("lesser_than", AlertPriority.low),
+    ],
+)
+async def test_calculate_value_rule_partially_missing_value(
+    sample_monitor: Monitor, operation, expected_priority
+):
+    """'_calculate_value_rule' should ignore the issues that don't have the 'value_key' in their
+    data and calculate the priority with the other issues"""
+    issues_data = [{"id": 1}, {"id": 2, "value": 25}, {"id": 3}, {"id": 4, "value": 15}]
+    issues = [
+        await Issue.create(monitor_id=sample_monitor.id, model_id=str(data["id"]), data=data)
+        for data in issues_data
+    ]
+
+    levels = {"greater_than": PriorityLevels(high=20), "lesser_than": PriorityLevels(low=20)}
+    rule = ValueRule(value_key="value", operation=operation, priority_levels=levels[operation])
+
+    assert priority._calculate_value_rule(rule, issues) == expected_priority
+
+
+@pytest.mark.parametrize(
+    "rule, expected_columns",
+    [
+        (AgeRule(priority_levels=PriorityLevels()), [Issue.created_at]),
+        (CountRule(priority_levels=PriorityLevels()), [Issue.id]),
+        (
+            ValueRule(
+                value_key="value", operation="greater_than", priority_levels=PriorityLevels()
+            ),
+            [Issue.data],
+        ),
+    ],
+)
+async def test_get_rule_columns(rule, expected_columns):
+    """'get_rule_columns' should return only the issues' columns used by the provided rule"""
+    assert priority.get_rule_columns(rule) == expected_columns
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        AgeRule(priority_levels=PriorityLevels(high=0)),
+        CountRule(priority_levels=PriorityLevels(high=2)),
+        ValueRule(
+            value_key="value", operation="greater_than", priority_levels=PriorityLevels(high=5)
+        ),
+    ],
+)
+async def test_calculate_priority_rule_columns(sample_monitor: Monitor, rule):
+    """'calculate_priority' should return the same priority when the issues are loaded with only
+    the columns used by the rule"""
+    issues = [
+        await Issue.create(
+            monitor_id=sample_monitor.id,
+            model_id=f"{i}",
+            data={"id": i, "value": 10},
+        )
+        for i in range(5)
+    ]
+    issues_rows = await Issue.get_raw(
+        columns=priority.get_rule_columns(rule),
+        column_filters=[Issue.monitor_id == sample_monitor.id],
+    )
+
+    assert priority.calculate_priority(rule, issues_rows) == AlertPriority.high
+    assert priority.calculate_priority(rule, issues) == AlertPriority.high
+
+
 @pytest.mark.parametrize(
     "rule",
     [
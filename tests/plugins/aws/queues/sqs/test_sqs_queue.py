@@ -1,18 +1,40 @@
 import asyncio
 import time
-from unittest.mock import AsyncMock
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import botocore.errorfactory
 import botocore.exceptions
+import pydantic
 import pytest
 import pytest_asyncio
 
 import plugins.aws.client as aws_client
 import plugins.aws.queues.sqs as sqs_queue
+from tests.test_utils import assert_message_in_log
 
 pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
+@pytest_asyncio.fixture(loop_scope="session", scope="module", autouse=True)
+async def close_queues(monkeypatch_module):
+    """Automatically close all the queues created in the tests"""
+    created_queues = []
+    original_init = sqs_queue.Queue.init
+
+    async def init_mock(self):
+        nonlocal created_queues
+        created_queues.append(self)
+        await original_init(self)
+
+    monkeypatch_module.setattr(sqs_queue.Queue, "init", init_mock)
+
+    yield
+
+    for queue in created_queues:
+        await queue.close()
+
+
 @pytest_asyncio.fixture(loop_scope="session", scope="function", autouse=True)
 async def clean_queue() -> None:
     """Clean the queue before each test"""
@@ -42,6 +64,22 @@ async def delete_queue(queue_url: str) -> None:
         assert e.response["Error"]["Code"] == "AWS.SimpleQueueService.NonExistentQueue"
 
 
+async def test_sqs_message_content(mocker):
+    """'SQSMessage.content' should decode the message body only when it's accessed for the first
+    time, reusing the decoded content for the next accesses"""
+    loads_spy: MagicMock = mocker.spy(sqs_queue.sqs_queue.json_tools, "loads")
+
+    message = sqs_queue.sqs_queue.SQSMessage(
+        {"ReceiptHandle": "handle", "Body": '{"type": "test", "payload": {"a": 1}}'}
+    )
+    loads_spy.assert_not_called()
+
+    assert message.id == "handle"
+    assert message.content == {"type": "test", "payload": {"a": 1}}
+    assert message.content is message.content
+    loads_spy.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "config",
     [
@@ -77,6 +115,20 @@ async def test_queue_init_aws_client_params(config):
         assert "region_name" not in queue._aws_client_params
 
 
+@pytest.mark.parametrize("receive_batch_size", [0, 11])
+async def test_queue_invalid_receive_batch_size(receive_batch_size):
+    """'Queue' should not accept a 'receive_batch_size' outside of the range accepted by SQS"""
+    with pytest.raises(pydantic.ValidationError, match="receive_batch_size"):
+        sqs_queue.Queue(
+            config={
+                "type": "plugin.aws.queues.sqs",
+                "name": "app",
+                "url": "http://motoserver:5000/123456789012/app",
+                "receive_batch_size": receive_batch_size,
+            }
+        )
+
+
 @pytest.mark.parametrize("queue_wait_message_time", [1, 2, 3, 4, 5])
 async def test_queue_wait_message_time(queue_wait_message_time):
     queue = sqs_queue.Queue(
@@ -348,3 +400,309 @@ async def test_delete_message():
 
     message = await queue.get_message()
     assert message is None
+
+
+async def test_aws_client_reused(mocker):
+    """The queue should create the AWS client once and reuse it for all the operations"""
+    aws_client_spy: MagicMock = mocker.spy(sqs_queue.sqs_queue, "aws_client")
+
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+            "create_queue": True,
+            "queue_wait_message_time": 0,
+            "queue_visibility_time": 1,
+        }
+    )
+    await queue.init()
+
+    await queue.send_message("test", {"a": 1})
+    message = await queue.get_message()
+    assert message is not None
+    await queue.change_visibility(message)
+    await queue.delete_message(message)
+
+    aws_client_spy.assert_called_once_with(
+        credential_name="application", service="sqs", region_name="us-east-1"
+    )
+
+
+async def test_aws_client_concurrent_creation(mocker):
+    """The queue should create only one AWS client when it's requested concurrently before being
+    created"""
+
+    @asynccontextmanager
+    async def aws_client_mock(**kwargs):
+        await asyncio.sleep(0.01)
+        yield MagicMock()
+
+    aws_client_patch: MagicMock = mocker.patch.object(
+        sqs_queue.sqs_queue, "aws_client", side_effect=aws_client_mock
+    )
+
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+        }
+    )
+
+    clients = await asyncio.gather(*[queue._get_client() for _ in range(5)])
+
+    assert all(client is clients[0] for client in clients)
+    aws_client_patch.assert_called_once()
+
+    await queue.close()
+
+
+async def test_close(mocker):
+    """'close' should close the AWS client, and a new one should be created if the queue is used
+    again"""
+    aws_client_spy: MagicMock = mocker.spy(sqs_queue.sqs_queue, "aws_client")
+
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+            "create_queue": True,
+            "queue_wait_message_time": 0,
+            "queue_visibility_time": 1,
+        }
+    )
+    await queue.init()
+    assert queue._client is not None
+
+    await queue.close()
+    assert queue._client is None
+
+    await queue.send_message("test", {"a": 1})
+    assert queue._client is not None
+    assert len(aws_client_spy.call_args_list) == 2
+
+    await queue.close()
+
+
+async def test_get_message_batch(mocker):
+    """'get_message' should receive the messages in batches, returning the extra messages in the
+    next calls without requesting them from the queue"""
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+            "create_queue": True,
+            "queue_wait_message_time": 0,
+            "queue_visibility_time": 15,
+            "receive_batch_size": 10,
+        }
+    )
+    await queue.init()
+
+    for i in range(3):
+        await queue.send_message("test", {"index": i})
+
+    receive_message_spy: AsyncMock = mocker.spy(queue._client, "receive_message")
+
+    messages = [await queue.get_message() for _ in range(3)]
+
+    assert sorted(message.content["payload"]["index"] for message in messages) == [0, 1, 2]
+    receive_message_spy.assert_awaited_once()
+    assert receive_message_spy.call_args.kwargs["MaxNumberOfMessages"] == 10
+
+    message = await queue.get_message()
+    assert message is None
+    assert receive_message_spy.await_count == 2
+
+
+async def test_get_message_batch_discard_expired(caplog, monkeypatch):
+    """'get_message' should discard prefetched messages that waited longer than the queue
+    visibility time, logging how many were discarded"""
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+            "create_queue": True,
+            "queue_wait_message_time": 0,
+            "queue_visibility_time": 15,
+        }
+    )
+    await queue.init()
+
+    await queue.send_message("test", {"a": 1})
+    await queue.send_message("test", {"a": 2})
+
+    message = await queue.get_message()
+    assert message is not None
+    assert len(queue._prefetched_messages) == 1
+
+    queue._prefetched_messages[0].received_at -= 15
+
+    message = await queue.get_message()
+    assert message is None
+    assert len(queue._prefetched_messages) == 0
+    assert_message_in_log(caplog, "Discarded 1 expired prefetched messages")
+
+
+def _queue_with_client_mock(send_message_batch: AsyncMock) -> sqs_queue.Queue:
+    """Create a queue using a client mock to send the messages"""
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+        }
+    )
+    queue._client = MagicMock(send_message_batch=send_message_batch)
+    return queue
+
+
+async def test_send_message_batch(mocker):
+    """'send_message' should group the messages sent at the same time, sending them in batches of
+    up to 10 messages"""
+    queue = sqs_queue.Queue(
+        config={
+            "type": "plugin.aws.queues.sqs",
+            "name": "app",
+            "url": "http://motoserver:5000/123456789012/app",
+            "region": "us-east-1",
+            "create_queue": True,
+            "queue_wait_message_time": 0,
+            "queue_visibility_time": 15,
+        }
+    )
+    await queue.init()
+
+    send_message_batch_spy: AsyncMock = mocker.spy(queue._client, "send_message_batch")
+
+    await asyncio.gather(*[queue.send_message("test", {"index": i}) for i in range(15)])
+
+    assert [len(call.kwargs["Entries"]) for call in send_message_batch_spy.call_args_list] == [
+        10,
+        5,
+    ]
+
+    received_indexes = []
+    while (message := await queue.get_message()) is not None:
+        received_indexes.append(message.content["payload"]["index"])
+    assert sorted(received_indexes) == list(range(15))
+
+
+async def test_send_message_batch_max_bytes(monkeypatch):
+    """'send_message' should not add messages to a batch if it would exceed the batch size
+    limit"""
+    monkeypatch.setattr(sqs_queue.sqs_queue, "SEND_BATCH_MAX_BYTES", 100)
+
+    send_message_batch = AsyncMock(return_value={})
+    queue = _queue_with_client_mock(send_message_batch)
+
+    await asyncio.gather(*[queue.send_message("test", {"value": "a" * 30}) for _ in range(3)])
+
+    assert [len(call.kwargs["Entries"]) for call in send_message_batch.call_args_list] == [
+        1,
+        1,
+        1,
+    ]
+
+    await queue.close()
+
+
+async def test_send_message_error():
+    """'send_message' should raise the error raised when sending the batch of messages"""
+    send_message_batch = AsyncMock(side_effect=ValueError("send error"))
+    queue = _queue_with_client_mock(send_message_batch)
+
+    results = await asyncio.gather(
+        queue.send_message("test", {"a": 1}),
+        queue.send_message("test", {"a": 2}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert all(str(result) == "send error" for result in results)
+    send_message_batch.assert_awaited_once()
+
+    await queue.close()
+
+
+async def test_send_message_failed():
+    """'send_message' should raise a 'RuntimeError' for the messages that failed to be sent in
+    the batch"""
+    send_message_batch = AsyncMock(
+        return_value={
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "Message": "some error"}],
+        }
+    )
+    queue = _queue_with_client_mock(send_message_batch)
+
+    results = await asyncio.gather(
+        queue.send_message("test", {"a": 1}),
+        queue.send_message("test", {"a": 2}),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert str(results[1]) == "Failed to send message: some error"
+
+    await queue.close()
+
+
+async def test_send_message_sender_cancelled():
+    """'send_message' should keep sending the other messages if a sender is cancelled while
+    waiting for the message to be sent"""
+    release_send = asyncio.Event()
+
+    async def send_message_batch(**kwargs):
+        await release_send.wait()
+        return {}
+
+    send_message_batch_mock = AsyncMock(side_effect=send_message_batch)
+    queue = _queue_with_client_mock(send_message_batch_mock)
+
+    send_task = asyncio.create_task(queue.send_message("test", {"a": 1}))
+    await asyncio.sleep(0.01)
+
+    send_task.cancel()
+    release_send.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await send_task
+
+    await queue.send_message("test", {"a": 2})
+    assert send_message_batch_mock.await_count == 2
+
+    await queue.close()
+
+
+async def test_close_pending_messages(monkeypatch):
+    """'close' should notify the senders of the messages that weren't sent yet"""
+    monkeypatch.setattr(sqs_queue.sqs_queue, "SEND_BATCH_MAX_BYTES", 100)
+
+    async def send_message_batch(**kwargs):
+        await asyncio.sleep(10)
+
+    queue = _queue_with_client_mock(AsyncMock(side_effect=send_message_batch))
+
+    send_tasks = [
+        asyncio.create_task(queue.send_message("test", {"value": "a" * 30})) for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+
+    await queue.close()
+
+    results = await asyncio.gather(*send_tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert all(str(result) == sqs_queue.sqs_queue.QUEUE_CLOSED_ERROR for result in results)
+    assert queue._sender_task is None
@@ -1,4 +1,5 @@
 import re
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -100,3 +101,16 @@ async def test_aws_client():
         response = await client.start_query_execution(QueryString="select 1")
         result = await client.get_query_results(QueryExecutionId=response["QueryExecutionId"])
         assert result["ResultSet"]["Rows"] == []
+
+
+async def test_aws_client_reuse_session(mocker):
+    """'aws_client' should use the same session to create all the clients"""
+    get_session_spy: MagicMock = mocker.spy(aws_client, "get_session")
+    aws_client._get_session.cache_clear()
+
+    async with aws_client.aws_client("application", "sqs"):
+        pass
+    async with aws_client.aws_client("application", "s3"):
+        pass
+
+    get_session_spy.assert_called_once()
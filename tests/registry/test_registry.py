@@ -5,6 +5,7 @@ from types import ModuleType
 import pytest
 
 import registry.registry as registry
+from data_models.monitor_options import ReactionOptions
 
 pytestmark = pytest.mark.asyncio(loop_scope="session")
 
@@ -178,6 +179,29 @@ async def test_get_monitor_module():
     assert registry.get_monitor_module(3) == module_3
 
 
+async def do_nothing(): ...
+
+
+async def test_get_monitor_reaction_events():
+    """'get_monitor_reaction_events' should return the events that have reactions configured for
+    the monitor"""
+    module = ModuleType(name="MockMonitorModule")
+    module.reaction_options = ReactionOptions(  # type: ignore[attr-defined]
+        alert_created=[do_nothing], issue_created=[do_nothing, do_nothing]
+    )
+    registry.add_monitor(1, "Monitor 1", module)
+
+    assert registry.get_monitor_reaction_events(1) == {"alert_created", "issue_created"}
+
+
+async def test_get_monitor_reaction_events_no_reaction_options():
+    """'get_monitor_reaction_events' should return an empty set if the monitor doesn't have the
+    'reaction_options' setting"""
+    registry.add_monitor(1, "Monitor 1", ModuleType(name="MockMonitorModule"))
+
+    assert registry.get_monitor_reaction_events(1) == frozenset()
+
+
 async def test_init():
     """'init' should reset the 'monitors_ready' and 'monitors_pending' events to their initial
     states"""
@@ -0,0 +1,132 @@
+import enum
+import importlib
+import json
+import math
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+
+import pytest
+
+import utils.json_tools as json_tools
+
+
+class SampleEnum(enum.Enum):
+    value = "enum_value"
+
+
+@dataclass
+class SampleDataclass:
+    a: int
+    b: list[date]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Reload the 'json_tools' module using 'orjson' or, with it blocked, the 'json' module,
+    returning the backend name"""
+    if request.param == "json":
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+    importlib.reload(json_tools)
+    yield request.param
+
+    monkeypatch.undo()
+    importlib.reload(json_tools)
+
+
+def test_backend(backend):
+    """'json_tools' should use 'orjson' when it's installed and the 'json' module otherwise"""
+    uses_orjson = "orjson" in json_tools.dumps.__code__.co_names
+    assert uses_orjson == (backend == "orjson")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"type": "event", "payload": {"a": 1, "b": [1, 2, 3], "c": None}},
+        {"type": "request", "payload": {"action": "alert_lock", "params": {"target_id": 1}}},
+        [1, "2", 3.5, True],
+        "string",
+    ],
+)
+def test_dumps(backend, data):
+    """'dumps' should serialize the data to a JSON string"""
+    result = json_tools.dumps(data)
+    assert isinstance(result, str)
+    assert json.loads(result) == data
+
+
+@pytest.mark.parametrize(
+    "data, expected_result",
+    [
+        ({"a": 1, "b": [1, 2]}, '{"a":1,"b":[1,2]}'),
+        ({"text": "ação ✓"}, '{"text":"ação ✓"}'),
+        ({1: "a", 1.5: "b", False: "c", None: "d"}, '{"1":"a","1.5":"b","false":"c","null":"d"}'),
+        (datetime(2024, 1, 2, 3, 4, 5, 123), '"2024-01-02T03:04:05.000123"'),
+        (datetime(2024, 1, 2, tzinfo=timezone.utc), '"2024-01-02T00:00:00+00:00"'),
+        (date(2024, 1, 2), '"2024-01-02"'),
+        (time(1, 2, 3), '"01:02:03"'),
+        (uuid.UUID(int=1), '"00000000-0000-0000-0000-000000000001"'),
+        (SampleEnum.value, '"enum_value"'),
+        (SampleDataclass(a=1, b=[date(2024, 1, 2)]), '{"a":1,"b":["2024-01-02"]}'),
+        (2**70, "1180591620717411303424"),
+        ({"value": -(2**70)}, '{"value":-1180591620717411303424}'),
+    ],
+)
+def test_dumps_same_output(backend, data, expected_result):
+    """'dumps' should serialize the data to the same string with both backends"""
+    assert json_tools.dumps(data) == expected_result
+
+
+@pytest.mark.parametrize("data", [object(), {"value": {1, 2}}])
+def test_dumps_not_serializable(backend, data):
+    """'dumps' should raise a 'TypeError' with both backends if the data can't be serialized"""
+    with pytest.raises(TypeError):
+        json_tools.dumps(data)
+
+
+def test_dumps_nan(backend):
+    """'dumps' should serialize 'NaN' as 'null' with 'orjson' and as 'NaN' with the 'json'
+    module, and both should be deserialized by 'loads'"""
+    result = json_tools.dumps({"value": math.nan})
+
+    if backend == "orjson":
+        assert result == '{"value":null}'
+        assert json_tools.loads(result) == {"value": None}
+    else:
+        assert result == '{"value":NaN}'
+        assert math.isnan(json_tools.loads(result)["value"])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"type": "event", "payload": {"a": 1, "b": [1, 2, 3], "c": None}},
+        {"type": "request", "payload": {"action": "alert_lock", "params": {"target_id": 1}}},
+        [1, "2", 3.5, True],
+        "string",
+    ],
+)
+def test_loads(backend, data):
+    """'loads' should deserialize a JSON string or bytes"""
+    assert json_tools.loads(json.dumps(data)) == data
+    assert json_tools.loads(json.dumps(data).encode()) == data
+
+
+def test_loads_json_module_values(backend):
+    """'loads' should deserialize the values that only the 'json' module writes, like 'NaN',
+    'Infinity' and integers larger than 64 bits"""
+    result = json_tools.loads('{"a":NaN,"b":Infinity,"c":1180591620717411303424}')
+
+    assert math.isnan(result["a"])
+    assert result["b"] == math.inf
+    assert result["c"] == 2**70
+
+
+@pytest.mark.parametrize("data", ["{", '{"a":}', "NaNa"])
+def test_loads_invalid(backend, data):
+    """'loads' should raise a 'ValueError' with both backends if the data is not a valid JSON"""
+    with pytest.raises(ValueError):
+        json_tools.loads(data)